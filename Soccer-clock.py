@@ -2,18 +2,43 @@ import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import filedialog, messagebox, ttk, colorchooser
 import csv
+import io
+import re
 import pygame
 import os
 import sys
 import time
 import wave
-import struct
 import threading
 import random
 import json
+import sqlite3
 import math
+import mmap
+import base64
+import bisect
+import hashlib
+import heapq
+import itertools
+import operator
+import warnings
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # NumPy ist optional, ohne läuft alles über array.array
+    np = None
+
+try:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+except ImportError:  # ab Python 3.13 nicht mehr Teil der Standardbibliothek
+    audioop = None
+
 # --- FARBPALETTE FC RSK FREYBURG ---
 RSK_BLUE = "#00529F"
 RSK_WHITE = "#FFFFFF"
@@ -42,10 +67,1737 @@ def get_settings_path():
     config_dir.mkdir(parents=True, exist_ok=True)
     return config_dir / "settings.json"
 
+
+# ====================================================================
+# --- HUPEN-SYNTHESE (IM SPEICHER) ---
+# ====================================================================
+
+# Hüllkurve: attack (Einschwingen), sustain (volle Lautstärke bis t),
+# release (Ausklingen am Ende), sustain_level (Pegel zwischen sustain und release)
+BUZZER_PRESETS = {
+    "halle": {"frequency": 160, "duration": 3.5, "attack": 0.08, "sustain": 2.4, "release": 0.6, "sustain_level": 0.85},
+    "kurz": {"frequency": 190, "duration": 1.6, "attack": 0.04, "sustain": 0.9, "release": 0.4, "sustain_level": 0.85},
+    "tief": {"frequency": 110, "duration": 4.5, "attack": 0.12, "sustain": 3.2, "release": 0.9, "sustain_level": 0.9},
+}
+DEFAULT_BUZZER_PRESET = "halle"
+
+
+class BuzzerSynth:
+    """Erzeugt die Hallenhupe als 16-Bit-PCM-Puffer in einem Rutsch.
+
+    Mit NumPy vektorisiert, sonst über array.array. Fertige Puffer werden je
+    (Preset, Samplerate, Kanäle) im Speicher gehalten.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    @staticmethod
+    def get_preset(name):
+        return BUZZER_PRESETS.get(name) or BUZZER_PRESETS[DEFAULT_BUZZER_PRESET]
+
+    def render(self, preset, sample_rate=22050, channels=1):
+        """Gibt interleavte signed-16-Bit-Samples (native Bytereihenfolge) als bytes zurück."""
+        if isinstance(preset, str):
+            preset = self.get_preset(preset)
+        key = (tuple(sorted(preset.items())), int(sample_rate), int(channels))
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        if np is not None:
+            data = self._render_numpy(preset, int(sample_rate), int(channels))
+        else:
+            data = self._render_array(preset, int(sample_rate), int(channels))
+        self._cache[key] = data
+        return data
+
+    @staticmethod
+    def _segment_bounds(preset, sample_rate, total_samples):
+        attack_end = min(total_samples, int(math.ceil(preset["attack"] * sample_rate)))
+        sustain_end = max(attack_end, min(total_samples, int(math.ceil(preset["sustain"] * sample_rate))))
+        release_start = max(sustain_end, min(total_samples, int(math.ceil((preset["duration"] - preset["release"]) * sample_rate))))
+        return attack_end, sustain_end, release_start
+
+    def _render_numpy(self, preset, sample_rate, channels):
+        duration = preset["duration"]
+        base_freq = preset["frequency"]
+        release = preset["release"]
+        level = preset["sustain_level"]
+        total_samples = int(sample_rate * duration)
+        attack_end, sustain_end, release_start = self._segment_bounds(preset, sample_rate, total_samples)
+
+        t = np.arange(total_samples, dtype=np.float64) / sample_rate
+        freq = base_freq + base_freq * 0.012 * np.sin(2 * np.pi * 1.4 * t)
+        angle = 2 * np.pi * freq * t
+        tone = (0.82 * np.sin(angle) + 0.35 * np.sin(angle * 2)) * 0.7
+
+        envelope = np.empty(total_samples, dtype=np.float64)
+        envelope[:attack_end] = t[:attack_end] / preset["attack"]
+        envelope[attack_end:sustain_end] = 1.0
+        envelope[sustain_end:release_start] = level
+        envelope[release_start:] = np.maximum(0.0, level * (1 - (t[release_start:] - (duration - release)) / release))
+
+        mono = (32767 * envelope * tone).astype(np.int16)
+        if channels > 1:
+            mono = np.repeat(mono, channels)
+        return mono.tobytes()
+
+    def _render_array(self, preset, sample_rate, channels):
+        duration = preset["duration"]
+        base_freq = preset["frequency"]
+        release = preset["release"]
+        level = preset["sustain_level"]
+        total_samples = int(sample_rate * duration)
+        attack_end, sustain_end, release_start = self._segment_bounds(preset, sample_rate, total_samples)
+
+        two_pi = 2 * math.pi
+        wobble = base_freq * 0.012
+        sin = math.sin
+        tone = [
+            (0.82 * sin(a) + 0.35 * sin(a * 2)) * 0.7
+            for a in (
+                two_pi * (base_freq + wobble * sin(two_pi * 1.4 * t)) * t
+                for t in (i / sample_rate for i in range(total_samples))
+            )
+        ]
+
+        attack_samples = preset["attack"] * sample_rate
+        release_from = duration - release
+        envelope = [i / attack_samples for i in range(attack_end)]
+        envelope.extend([1.0] * (sustain_end - attack_end))
+        envelope.extend([level] * (release_start - sustain_end))
+        envelope.extend(
+            max(0.0, level * (1 - (i / sample_rate - release_from) / release))
+            for i in range(release_start, total_samples)
+        )
+
+        mono = array("h", [int(32767 * e * v) for e, v in zip(envelope, tone)])
+        if channels <= 1:
+            return mono.tobytes()
+
+        interleaved = array("h", bytes(2 * total_samples * channels))
+        for channel in range(channels):
+            interleaved[channel::channels] = mono
+        return interleaved.tobytes()
+
+
+# ====================================================================
+# --- WAV-ANALYSE (STREAMING) ---
+# ====================================================================
+
+WAVE_ANALYSIS_POINTS = 1200
+WAVE_BLOCK_FRAMES = 65536
+WAVE_MMAP_THRESHOLD = 32 * 1024 * 1024
+
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# (Formatkennung, Bytes pro Sample) -> array-Typcode und Vollausschlag
+_PCM_LAYOUTS = {
+    (WAVE_FORMAT_PCM, 1): ("B", 128.0),
+    (WAVE_FORMAT_PCM, 2): ("h", 32768.0),
+    (WAVE_FORMAT_PCM, 3): ("i", 2147483648.0),
+    (WAVE_FORMAT_PCM, 4): ("i", 2147483648.0),
+    (WAVE_FORMAT_IEEE_FLOAT, 4): ("f", 1.0),
+    (WAVE_FORMAT_IEEE_FLOAT, 8): ("d", 1.0),
+}
+
+
+class WavInfo:
+    """Kopfdaten einer WAV-Datei inklusive Lage des data-Chunks."""
+
+    __slots__ = ("format_tag", "channels", "sample_rate", "sampwidth", "data_offset", "data_size")
+
+    def __init__(self, format_tag, channels, sample_rate, sampwidth, data_offset, data_size):
+        self.format_tag = format_tag
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.sampwidth = sampwidth
+        self.data_offset = data_offset
+        self.data_size = data_size
+
+    @property
+    def frame_size(self):
+        return self.channels * self.sampwidth
+
+    @property
+    def n_frames(self):
+        return self.data_size // self.frame_size
+
+    @property
+    def duration(self):
+        return self.n_frames / float(self.sample_rate)
+
+
+def read_wav_info(fh):
+    """Liest den RIFF/WAVE-Kopf (PCM, IEEE-Float, WAVE_FORMAT_EXTENSIBLE).
+
+    Der Dateizeiger steht danach am Anfang der Audiodaten. Nicht
+    unterstützte Formate lösen ValueError aus.
+    """
+    fh.seek(0, os.SEEK_END)
+    file_size = fh.tell()
+    fh.seek(0)
+    header = fh.read(12)
+    if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        raise ValueError("Keine RIFF/WAVE-Datei")
+
+    fmt = None
+    while True:
+        chunk_header = fh.read(8)
+        if len(chunk_header) < 8:
+            raise ValueError("Kein data-Chunk gefunden")
+        chunk_id = chunk_header[:4]
+        chunk_size = int.from_bytes(chunk_header[4:8], "little")
+
+        if chunk_id == b"fmt ":
+            body = fh.read(chunk_size)
+            if len(body) < 16:
+                raise ValueError("fmt-Chunk zu kurz")
+            format_tag = int.from_bytes(body[0:2], "little")
+            channels = int.from_bytes(body[2:4], "little")
+            sample_rate = int.from_bytes(body[4:8], "little")
+            block_align = int.from_bytes(body[12:14], "little")
+            if format_tag == WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                # Die ersten zwei Bytes der SubFormat-GUID sind die eigentliche Formatkennung
+                format_tag = int.from_bytes(body[24:26], "little")
+            fmt = (format_tag, channels, sample_rate, block_align)
+            if chunk_size & 1:
+                fh.seek(1, os.SEEK_CUR)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("data-Chunk vor fmt-Chunk")
+            format_tag, channels, sample_rate, block_align = fmt
+            if not channels or not sample_rate or block_align % channels:
+                raise ValueError("Ungültiger fmt-Chunk")
+            sampwidth = block_align // channels
+            if (format_tag, sampwidth) not in _PCM_LAYOUTS:
+                raise ValueError(f"Nicht unterstütztes WAV-Format ({format_tag:#06x}, {sampwidth * 8} Bit)")
+            data_offset = fh.tell()
+            data_size = min(chunk_size, file_size - data_offset)
+            return WavInfo(format_tag, channels, sample_rate, sampwidth, data_offset, data_size)
+        else:
+            fh.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+
+def decode_pcm_block(raw, info):
+    """Dekodiert einen Block roher Frames gesammelt in normierte Samples (-1..1).
+
+    Mit NumPy ein float32-Array, sonst array('f') bzw. eine memoryview auf
+    Float-Daten. Es gibt keine Python-Schleife pro Sample.
+    """
+    fmt_code, full_scale = _PCM_LAYOUTS[(info.format_tag, info.sampwidth)]
+
+    if info.sampwidth == 3:
+        # 24 Bit in die oberen drei Bytes eines 32-Bit-Worts schieben
+        count = len(raw) // 3
+        widened = bytearray(count * 4)
+        widened[1::4] = raw[0::3]
+        widened[2::4] = raw[1::3]
+        widened[3::4] = raw[2::3]
+        raw = widened
+
+    if np is not None:
+        dtype = np.dtype(fmt_code).newbyteorder("<")
+        samples = np.frombuffer(raw, dtype=dtype).astype(np.float32)
+        if fmt_code == "B":
+            samples -= 128.0
+        if full_scale != 1.0:
+            samples *= 1.0 / full_scale
+        return samples
+
+    if sys.byteorder == "little":
+        samples = memoryview(raw).cast(fmt_code)
+    else:
+        samples = array(fmt_code, bytes(raw))
+        if fmt_code != "B":
+            samples.byteswap()
+    if fmt_code in ("f", "d"):
+        return samples
+    factor = 1.0 / full_scale
+    if fmt_code == "B":
+        return array("f", map(factor.__mul__, map((-128).__add__, samples)))
+    return array("f", map(factor.__mul__, samples))
+
+
+AUDIBLE_THRESHOLD = 10 ** (-45 / 20)
+LOUDEST_SECTION_SECONDS = 5.0
+
+
+class WaveEnvelope:
+    """Min/Max/RMS-Hüllkurve (normiert auf -1..1) in fester Grundauflösung.
+
+    Für jede gewünschte Breite wird aus der Grundauflösung neu gruppiert,
+    ohne die Datei erneut zu lesen.
+    """
+
+    def __init__(self, mins, maxs, rms):
+        self.mins = array("f", mins)
+        self.maxs = array("f", maxs)
+        self.rms = array("f", rms)
+        self._peaks = None
+
+    def __len__(self):
+        return len(self.maxs)
+
+    def base_peaks(self):
+        if self._peaks is None:
+            self._peaks = array("f", map(max, map(abs, self.mins), map(abs, self.maxs)))
+        return self._peaks
+
+    def max_peak(self):
+        return max(self.base_peaks(), default=0.0)
+
+    def gated_loudness_db(self, absolute_gate_db=-70.0, relative_gate_db=-10.0):
+        """Lautheit in dBFS aus den RMS-Blöcken, zweistufig gegatet wie bei EBU R128.
+
+        Ohne K-Filter, daher ein Näherungswert; Pausen und Ausklang zählen nicht mit.
+        """
+        floor = 10 ** (absolute_gate_db / 10)
+        energies = [value * value for value in self.rms if value * value > floor]
+        if not energies:
+            return None
+        threshold = sum(energies) / len(energies) * 10 ** (relative_gate_db / 10)
+        gated = [energy for energy in energies if energy > threshold]
+        return 10 * math.log10(sum(gated) / len(gated))
+
+    def first_audible_index(self, threshold=AUDIBLE_THRESHOLD):
+        """Index des ersten Blocks, dessen Spitzenpegel ``threshold`` erreicht."""
+        return next((index for index, peak in enumerate(self.base_peaks()) if peak >= threshold), 0)
+
+    def loudest_window_index(self, window):
+        """Startindex des ``window`` Blöcke langen Abschnitts mit der meisten Energie."""
+        energies = [value * value for value in self.rms]
+        window = max(1, min(int(window), len(energies)))
+        if not energies:
+            return 0
+        current = best = sum(energies[:window])
+        best_index = 0
+        for index in range(window, len(energies)):
+            current += energies[index] - energies[index - window]
+            if current > best:
+                best, best_index = current, index - window + 1
+        return best_index
+
+    def trimmed(self, start_index):
+        """Hüllkurve ab ``start_index``, passend zu einer gekürzten Wiedergabe."""
+        if start_index <= 0:
+            return self
+        return WaveEnvelope(self.mins[start_index:], self.maxs[start_index:], self.rms[start_index:])
+
+    def _groups(self, width):
+        count = len(self.maxs)
+        width = max(1, min(int(width), count))
+        for col in range(width):
+            yield col * count // width, (col + 1) * count // width
+
+    def peaks(self, width):
+        """Spitzenpegel je Spalte als array('f')."""
+        base = self.base_peaks()
+        if width >= len(base):
+            return array("f", base)
+        return array("f", (max(base[a:b]) for a, b in self._groups(width)))
+
+    def rms_values(self, width):
+        if width >= len(self.rms):
+            return array("f", self.rms)
+        return array("f", (
+            math.sqrt(sum(map(float.__mul__, self.rms[a:b], self.rms[a:b])) / (b - a))
+            for a, b in self._groups(width)
+        ))
+
+    def to_cache(self):
+        return {
+            "min": base64.b64encode(self.mins.tobytes()).decode("ascii"),
+            "max": base64.b64encode(self.maxs.tobytes()).decode("ascii"),
+            "rms": base64.b64encode(self.rms.tobytes()).decode("ascii"),
+        }
+
+    @classmethod
+    def from_cache(cls, data):
+        if not data:
+            return None
+        try:
+            arrays = []
+            for key in ("min", "max", "rms"):
+                values = array("f")
+                values.frombytes(base64.b64decode(data[key]))
+                arrays.append(values)
+        except Exception:
+            return None
+        return cls(*arrays)
+
+
+class EnvelopeReducer:
+    """Fasst blockweise gelieferte PCM-Samples in einem Durchlauf zu einer WaveEnvelope zusammen.
+
+    Blöcke sind normierte Samples (siehe decode_pcm_block) als array,
+    memoryview oder NumPy-Array.
+    """
+
+    def __init__(self, n_frames, n_channels, points=WAVE_ANALYSIS_POINTS):
+        self.n_frames = n_frames
+        self.n_channels = n_channels
+        self.points = max(1, min(points, n_frames))
+        self._mins = [math.inf] * self.points
+        self._maxs = [-math.inf] * self.points
+        self._sumsq = [0.0] * self.points
+        self._counts = [0] * self.points
+        self._bucket = 0
+        self._bucket_end = n_frames // self.points
+        self._frame_pos = 0
+
+    def add(self, block, frames):
+        if np is not None and not isinstance(block, np.ndarray):
+            block = np.asarray(block)
+        if np is not None:
+            block = block.astype(np.float64)
+
+        block_start = self._frame_pos
+        block_end = min(self.n_frames, block_start + frames)
+        channels = self.n_channels
+        pos = block_start
+        while pos < block_end:
+            while self._bucket_end <= pos:
+                self._bucket += 1
+                self._bucket_end = (self._bucket + 1) * self.n_frames // self.points
+            stop = min(block_end, self._bucket_end)
+            chunk = block[(pos - block_start) * channels:(stop - block_start) * channels]
+            bucket = self._bucket
+
+            if np is not None:
+                lo, hi = float(chunk.min()), float(chunk.max())
+                squares = float(np.dot(chunk, chunk))
+            else:
+                lo, hi = min(chunk), max(chunk)
+                squares = sum(map(operator.mul, chunk, chunk))
+
+            if lo < self._mins[bucket]:
+                self._mins[bucket] = lo
+            if hi > self._maxs[bucket]:
+                self._maxs[bucket] = hi
+            self._sumsq[bucket] += squares
+            self._counts[bucket] += len(chunk)
+            pos = stop
+
+        self._frame_pos = block_end
+
+    def result(self):
+        mins, maxs, rms = [], [], []
+        for lo, hi, squares, count in zip(self._mins, self._maxs, self._sumsq, self._counts):
+            if not count:
+                mins.append(0.0)
+                maxs.append(0.0)
+                rms.append(0.0)
+                continue
+            mins.append(lo)
+            maxs.append(hi)
+            rms.append(math.sqrt(squares / count))
+        return WaveEnvelope(mins, maxs, rms)
+
+
+def analyze_wav_envelope(path, points=WAVE_ANALYSIS_POINTS, block_frames=WAVE_BLOCK_FRAMES, use_mmap=None):
+    """Berechnet die Hüllkurve blockweise über die ganze Datei.
+
+    Es wird nie mehr als ein Block von ``block_frames`` Frames gleichzeitig
+    dekodiert; große Dateien (ab WAVE_MMAP_THRESHOLD) werden per mmap gelesen.
+    Gibt ``(envelope, duration)`` zurück, bei nicht unterstützten Formaten ``(None, 0)``.
+    """
+    with open(path, "rb") as fh:
+        try:
+            info = read_wav_info(fh)
+        except ValueError:
+            return None, 0
+
+        n_frames = info.n_frames
+        if n_frames == 0:
+            return None, info.duration
+
+        if use_mmap is None:
+            use_mmap = os.fstat(fh.fileno()).st_size >= WAVE_MMAP_THRESHOLD
+        mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) if use_mmap else None
+        try:
+            frame_size = info.frame_size
+            reducer = EnvelopeReducer(n_frames, info.channels, points)
+
+            frame_pos = 0
+            while frame_pos < n_frames:
+                count = min(block_frames, n_frames - frame_pos)
+                if mapped is not None:
+                    start = info.data_offset + frame_pos * frame_size
+                    raw = mapped[start:start + count * frame_size]
+                else:
+                    raw = fh.read(count * frame_size)
+                    count = len(raw) // frame_size
+                    if count == 0:
+                        break
+                    raw = raw[:count * frame_size]
+                reducer.add(decode_pcm_block(raw, info), count)
+                frame_pos += count
+
+            return reducer.result(), info.duration
+        finally:
+            if mapped is not None:
+                mapped.close()
+
+
+LOUDNESS_TARGET_DB = -20.0
+
+
+def loudness_gain(loudness_db, target_db=LOUDNESS_TARGET_DB):
+    """Lautstärkefaktor für Sound.set_volume; pygame kann nur absenken, daher höchstens 1.0."""
+    if loudness_db is None:
+        return 1.0
+    return min(1.0, 10 ** ((target_db - loudness_db) / 20))
+
+
+# ====================================================================
+# --- KLASSE: PEAK-CACHE (PERSISTENT, LRU) ---
+# ====================================================================
+
+class PeakCache:
+    """Speichert Analyseergebnisse je Audiodatei als JSON im Konfigurationsordner.
+
+    Schlüssel ist Pfad + Größe + Änderungszeit, eine geänderte Datei wird also
+    automatisch neu analysiert. Jeder Eintrag liegt in einer eigenen kleinen
+    Datei. put() ändert nur den Speicherstand; ein einzelner Schreib-Thread
+    sammelt die geänderten Einträge und schreibt sie außerhalb der Sperre,
+    mehrfach geänderte Einträge nur einmal. Ältere Einträge fallen nach LRU
+    heraus.
+    """
+
+    VERSION = 3
+    # Zugriffe frischen die Änderungszeit der Eintragsdatei höchstens so oft auf (s)
+    TOUCH_INTERVAL = 600
+
+    def __init__(self, cache_dir, max_entries=1000):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = {}
+        self._flush_pending = False
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="peak-cache")
+        self._writes_since_prune = 0
+        self._touched = {}
+
+    @staticmethod
+    def file_key(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    def _entry_file(self, key):
+        return self.cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    def _read_entry(self, key):
+        try:
+            with open(self._entry_file(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return None
+        if data.get("version") != self.VERSION or data.get("key") != key:
+            return None
+        return data.get("entry")
+
+    def _remember_locked(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, path):
+        key = self.file_key(path)
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key) or self._dirty.get(key)
+            if entry is not None:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                self._touch_locked(key)
+                return entry
+        entry = self._read_entry(key)
+        if entry is None:
+            return None
+        with self._lock:
+            # Ein zwischenzeitliches put() hat Vorrang vor dem Plattenstand
+            entry = self._entries.get(key, entry)
+            self._remember_locked(key, entry)
+            self._touch_locked(key)
+        return entry
+
+    def _touch_locked(self, key):
+        """Markiert den Eintrag auf der Platte als benutzt, damit _prune() nach LRU räumt."""
+        now = time.monotonic()
+        last = self._touched.get(key)
+        if last is not None and now - last < self.TOUCH_INTERVAL:
+            return
+        if len(self._touched) >= 2 * self.max_entries:
+            self._touched.clear()
+        self._touched[key] = now
+        self._writer.submit(self._touch_file, self._entry_file(key))
+
+    @staticmethod
+    def _touch_file(file):
+        try:
+            os.utime(file)
+        except OSError:
+            pass
+
+    def put(self, path, **values):
+        """Ergänzt bzw. überschreibt Felder des Eintrags und schreibt ihn auf die Platte."""
+        self.put_many([(path, values)])
+
+    def put_many(self, items):
+        """Wie put() für viele ``(path, values)``-Paare."""
+        keyed = []
+        for path, values in items:
+            key = self.file_key(path)
+            if key is None:
+                continue
+            with self._lock:
+                known = key in self._entries or key in self._dirty
+            # Nicht mehr im Speicher: Felder vom Plattenstand übernehmen
+            keyed.append((key, values, None if known else self._read_entry(key)))
+
+        with self._lock:
+            for key, values, stored in keyed:
+                entry = dict(self._entries.get(key) or self._dirty.get(key) or stored or {})
+                entry.update(values)
+                self._remember_locked(key, entry)
+                self._dirty[key] = entry
+            if self._dirty and not self._flush_pending:
+                self._flush_pending = True
+                self._writer.submit(self._flush)
+
+    def flush(self):
+        """Wartet, bis alle geänderten Einträge auf der Platte liegen."""
+        self._writer.submit(lambda: None).result()
+
+    def _flush(self):
+        with self._lock:
+            snapshot = list(self._dirty.items())
+            self._dirty.clear()
+            self._flush_pending = False
+        self._write_entries(snapshot)
+
+    def _write_entries(self, snapshot):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return
+        for key, entry in snapshot:
+            target = self._entry_file(key)
+            tmp_path = target.with_name(target.name + ".tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"version": self.VERSION, "key": key, "entry": entry}, f)
+                os.replace(tmp_path, target)
+            except Exception:
+                pass
+        self._writes_since_prune += len(snapshot)
+        if self._writes_since_prune >= max(1, self.max_entries // 10):
+            self._writes_since_prune = 0
+            self._prune()
+
+    def _prune(self):
+        try:
+            files = sorted(self.cache_dir.glob("*.json"), key=lambda file: file.stat().st_mtime)
+        except OSError:
+            return
+        for file in files[:max(0, len(files) - self.max_entries)]:
+            try:
+                file.unlink()
+            except OSError:
+                pass
+
+
+# ====================================================================
+# --- KLASSE: RESAMPLING-CACHE (MIXER-FORMAT) ---
+# ====================================================================
+
+class ResampleCache:
+    """Wandelt WAV-Dateien einmalig in das Format des laufenden Mixers um.
+
+    Die Ergebnisse (16 Bit, Mixer-Samplerate und -Kanalzahl) liegen als WAV
+    im Konfigurationsordner und werden sitzungsübergreifend wiederverwendet,
+    sodass SDL beim Laden nicht mehr resamplen muss. Umgerechnet wird
+    blockweise mit über die Blockgrenzen fortgeführtem Zustand. Ohne NumPy wird
+    audioop verwendet; fehlt beides, bleibt es bei der Originaldatei.
+    """
+
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def target_format():
+        init = pygame.mixer.get_init()
+        if not init or init[1] != -16:
+            return None
+        return init[0], init[2]
+
+    def _cache_file(self, path, target):
+        key = PeakCache.file_key(path)
+        if key is None or target is None:
+            return None
+        digest = hashlib.sha1(f"{key}|{target[0]}|{target[1]}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.wav"
+
+    def cached_path(self, path):
+        """Pfad der umgewandelten Datei oder None, falls (noch) nicht vorhanden."""
+        cache_file = self._cache_file(path, self.target_format())
+        if cache_file is not None and cache_file.exists():
+            return cache_file
+        return None
+
+    def ensure(self, path):
+        """Wandelt ``path`` bei Bedarf um (blockierend, für Hintergrund-Threads)."""
+        target = self.target_format()
+        cache_file = self._cache_file(path, target)
+        if cache_file is None:
+            return None
+        with self._lock:
+            if cache_file.exists():
+                try:
+                    os.utime(cache_file)
+                except OSError:
+                    pass
+                return cache_file
+            try:
+                if not self._convert(path, cache_file, *target):
+                    return None
+            except Exception:
+                return None
+            self._prune()
+        return cache_file
+
+    def prepare(self, paths):
+        paths = [p for p in paths if p]
+        if paths:
+            threading.Thread(target=lambda: [self.ensure(p) for p in paths], daemon=True).start()
+
+    def load_sound(self, path):
+        """Sound direkt aus den umgewandelten PCM-Daten, ohne Konvertierung durch SDL."""
+        cache_file = self.cached_path(path)
+        if cache_file is None:
+            return None
+        try:
+            with open(cache_file, "rb") as fh:
+                info = read_wav_info(fh)
+                data = fh.read(info.data_size)
+            if sys.byteorder != "little":
+                samples = array("h", data)
+                samples.byteswap()
+                data = samples.tobytes()
+            return pygame.mixer.Sound(buffer=data)
+        except Exception:
+            return None
+
+    def _convert(self, src, dst, rate, channels):
+        with open(src, "rb") as fh:
+            info = read_wav_info(fh)
+            if (info.format_tag, info.sampwidth, info.sample_rate, info.channels) == (WAVE_FORMAT_PCM, 2, rate, channels):
+                return False
+            if np is not None:
+                converter = self._convert_numpy
+            elif audioop is not None and info.channels <= 2 and channels <= 2:
+                converter = self._convert_audioop
+            else:
+                return False
+
+            def blocks():
+                while True:
+                    raw = fh.read(WAVE_BLOCK_FRAMES * info.frame_size)
+                    usable = len(raw) - len(raw) % info.frame_size
+                    if usable <= 0:
+                        return
+                    yield decode_pcm_block(raw[:usable], info)
+
+            # Blockweise lesen, umrechnen und schreiben: der Speicherbedarf
+            # hängt nur von der Blockgröße ab, nicht von der Länge der Datei
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = dst.with_name(dst.name + ".tmp")
+            written = 0
+            with wave.open(str(tmp_path), "wb") as wf:
+                wf.setnchannels(channels)
+                wf.setsampwidth(2)
+                wf.setframerate(rate)
+                for pcm in converter(blocks(), info, rate, channels):
+                    wf.writeframesraw(pcm)
+                    written += len(pcm)
+        if not written:
+            os.remove(tmp_path)
+            return False
+        os.replace(tmp_path, dst)
+        return True
+
+    @staticmethod
+    def _convert_numpy(blocks, info, rate, channels):
+        step = info.sample_rate / rate
+        produced = 0
+        consumed = 0
+        # Letzter Frame des Vorgängerblocks als linker Stützpunkt der Interpolation
+        previous = None
+        for block in blocks:
+            samples = np.asarray(block, dtype=np.float32).reshape(-1, info.channels)
+            if channels == 1 and info.channels > 1:
+                samples = samples.mean(axis=1, keepdims=True)
+            elif info.channels == 1 and channels > 1:
+                samples = np.repeat(samples, channels, axis=1)
+            elif info.channels >= channels:
+                samples = samples[:, :channels]
+            else:
+                samples = np.concatenate([samples, np.repeat(samples[:, -1:], channels - info.channels, axis=1)], axis=1)
+
+            if info.sample_rate != rate:
+                first_index = consumed
+                if previous is not None:
+                    samples = np.concatenate([previous, samples])
+                    first_index -= 1
+                consumed += len(samples) - (previous is not None)
+                previous = samples[-1:]
+                # Ausgabeframes, deren Quellposition in diesem Block liegt
+                last_output = int((consumed - 1) / step)
+                if last_output < produced:
+                    continue
+                positions = np.arange(produced, last_output + 1) * step - first_index
+                produced = last_output + 1
+                local_index = np.arange(len(samples))
+                samples = np.column_stack([np.interp(positions, local_index, samples[:, c]) for c in range(channels)])
+
+            yield (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+    @staticmethod
+    def _convert_audioop(blocks, info, rate, channels):
+        state = None
+        for block in blocks:
+            floats = block if isinstance(block, array) else array("f", block)
+            clipped = map(max, itertools.repeat(-1.0), map(min, itertools.repeat(1.0), floats))
+            fragment = array("h", map(int, map((32767.0).__mul__, clipped))).tobytes()
+
+            if info.channels == 2 and channels == 1:
+                fragment = audioop.tomono(fragment, 2, 0.5, 0.5)
+            elif info.channels == 1 and channels == 2:
+                fragment = audioop.tostereo(fragment, 2, 1.0, 1.0)
+            if info.sample_rate != rate:
+                # ratecv führt seinen Zustand über die Blockgrenzen weiter
+                fragment, state = audioop.ratecv(fragment, 2, channels, info.sample_rate, rate, state)
+            if sys.byteorder != "little":
+                fragment = audioop.byteswap(fragment, 2)
+            yield fragment
+
+    def _prune(self):
+        try:
+            files = sorted(self.cache_dir.glob("*.wav"), key=lambda p: p.stat().st_mtime)
+            total = sum(p.stat().st_size for p in files)
+            while files and total > self.max_bytes:
+                oldest = files.pop(0)
+                total -= oldest.stat().st_size
+                oldest.unlink()
+        except OSError:
+            pass
+
+
+# ====================================================================
+# --- KLASSE: ANALYSE-DIENST (THREAD-POOL) ---
+# ====================================================================
+
+class AnalysisService:
+    """Begrenzter Worker-Pool für Audioanalysen mit Verdrängung veralteter Aufträge.
+
+    Aufträge laufen in einer "Spur" (z.B. "jingle", "prefetch"); ein neuer
+    Auftrag verdrängt alle älteren derselben Spur. Nur das Ergebnis des
+    jeweils neuesten Auftrags wird per ``root.after`` im Tk-Thread zugestellt;
+    scheitert die Analyse, kommt ``(None, 0)`` an.
+    """
+
+    def __init__(self, root, analyze_fn, max_workers=2, max_pending=4):
+        self.root = root
+        self.analyze_fn = analyze_fn
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wav-analyse")
+        # RLock: Future.cancel() ruft _forget() synchron im selben Thread auf
+        self._lock = threading.RLock()
+        self._next_id = 0
+        self._latest = {}
+        self._pending = OrderedDict()
+        self.submitted = 0
+        self.completed = 0
+        self.superseded = 0
+        self.failed = 0
+        self.last_latency_ms = 0.0
+        self._latency_total_ms = 0.0
+
+    def submit(self, lane, path, callback):
+        with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            self._latest[lane] = request_id
+            self.submitted += 1
+
+            # Abgebrochene Aufträge entfernt ihr Done-Callback (_forget) aus
+            # _pending; laufende bleiben bis zum Ende in der Warteschlangentiefe
+            for pending_lane, future in list(self._pending.values()):
+                if pending_lane == lane and future.cancel():
+                    self.superseded += 1
+            for _pending_lane, future in list(self._pending.values()):
+                if len(self._pending) < self.max_pending:
+                    break
+                if future.cancel():
+                    self.superseded += 1
+
+            future = self._executor.submit(self._run, lane, request_id, path, callback, time.perf_counter())
+            self._pending[request_id] = (lane, future)
+        future.add_done_callback(lambda _f, rid=request_id: self._forget(rid))
+        return request_id
+
+    def cancel(self, lane):
+        """Verwirft alle offenen und laufenden Aufträge der Spur."""
+        with self._lock:
+            self._next_id += 1
+            self._latest[lane] = self._next_id
+            for pending_lane, future in list(self._pending.values()):
+                if pending_lane == lane and future.cancel():
+                    self.superseded += 1
+
+    def _forget(self, request_id):
+        with self._lock:
+            self._pending.pop(request_id, None)
+
+    def _is_latest(self, lane, request_id):
+        with self._lock:
+            return self._latest.get(lane) == request_id
+
+    def _run(self, lane, request_id, path, callback, submitted_at):
+        if not self._is_latest(lane, request_id):
+            with self._lock:
+                self.superseded += 1
+            return
+        try:
+            result = self.analyze_fn(path)
+        except Exception:
+            # Ohne Zustellung bliebe die Anzeige im Ladezustand stehen
+            result = (None, 0)
+            with self._lock:
+                self.failed += 1
+        latency_ms = (time.perf_counter() - submitted_at) * 1000
+        with self._lock:
+            self.completed += 1
+            self.last_latency_ms = latency_ms
+            self._latency_total_ms += latency_ms
+        self.root.after(0, self._deliver, lane, request_id, callback, result)
+
+    def _deliver(self, lane, request_id, callback, result):
+        if not self._is_latest(lane, request_id):
+            with self._lock:
+                self.superseded += 1
+            return
+        callback(*result)
+
+    @property
+    def queue_depth(self):
+        with self._lock:
+            return len(self._pending)
+
+    def get_stats(self):
+        with self._lock:
+            avg = self._latency_total_ms / self.completed if self.completed else 0.0
+            return {
+                "queue_depth": len(self._pending),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "superseded": self.superseded,
+                "failed": self.failed,
+                "last_latency_ms": round(self.last_latency_ms, 1),
+                "avg_latency_ms": round(avg, 1),
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# ====================================================================
+# --- KLASSE: AUDIO-ENGINE (MIXER-KONFIGURATION & LATENZ) ---
+# ====================================================================
+
+AUDIO_SAMPLE_RATES = (22050, 44100, 48000)
+AUDIO_BUFFER_SIZES = (256, 512, 1024, 2048, 4096)
+# Zwei Jingle-Kanäle, damit zwischen Jingles überblendet werden kann
+JINGLE_CHANNELS = (0, 1)
+
+
+class AudioEngine:
+    """Startet den pygame-Mixer mit einstellbarer Samplerate und Puffergröße.
+
+    Reserviert einen festen Kanal für die Hupe und kann die Latenz abschätzen.
+    Die echte Ausgabelatenz ist ohne Rückkanal nicht messbar; gemessen werden
+    die Dauer des play()-Aufrufs und der Weck-Jitter des Rechners, daraus und
+    aus der Pufferdauer ergeben sich Schätzung und kleinster Puffer ohne
+    Aussetzer.
+    """
+
+    def __init__(self, frequency=22050, buffer=512, channels=2, buzzer_channel=2):
+        self.frequency = frequency
+        self.buffer = buffer
+        self.channels = channels
+        self.buzzer_channel = buzzer_channel
+        self._buzzer_channel = None
+        self.last_probe = None
+
+    @property
+    def config(self):
+        return self.frequency, self.buffer, self.channels, self.buzzer_channel
+
+    def configure(self, frequency, buffer, channels, buzzer_channel):
+        """Übernimmt neue Werte; True, wenn der Mixer neu gestartet werden muss."""
+        buzzer_channel = max(len(JINGLE_CHANNELS), int(buzzer_channel))
+        new_config = (int(frequency), int(buffer), 1 if int(channels) == 1 else 2, buzzer_channel)
+        changed = new_config != self.config
+        self.frequency, self.buffer, self.channels, self.buzzer_channel = new_config
+        return changed
+
+    def start(self):
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
+        self._buzzer_channel = None
+        try:
+            pygame.mixer.init(frequency=self.frequency, size=-16, channels=self.channels, buffer=self.buffer)
+        except Exception:
+            try:
+                # Rückfall auf die bisherige Minimalkonfiguration
+                pygame.mixer.init(frequency=22050)
+            except Exception:
+                return False
+        return True
+
+    def reserve_channels(self):
+        """Reserviert Jingle- und Hupenkanäle; liefert die Anzahl reservierter Kanäle."""
+        if not pygame.mixer.get_init():
+            return 0
+        reserved = max(*JINGLE_CHANNELS, self.buzzer_channel) + 1
+        if pygame.mixer.get_num_channels() < reserved + 4:
+            pygame.mixer.set_num_channels(reserved + 4)
+        pygame.mixer.set_reserved(reserved)
+        self._buzzer_channel = pygame.mixer.Channel(self.buzzer_channel)
+        return reserved
+
+    def get_buzzer_channel(self):
+        return self._buzzer_channel
+
+    def buffer_ms(self):
+        init = pygame.mixer.get_init()
+        frequency = init[0] if init else self.frequency
+        return self.buffer / frequency * 1000
+
+    def probe_latency(self, trials=5, jitter_window=0.3):
+        """Misst die Latenz (blockierend, für Hintergrund-Threads).
+
+        Läuft auf einem freien, nicht reservierten Kanal, damit Jingles und
+        Hupe nicht abgeschnitten werden.
+        """
+        init = pygame.mixer.get_init()
+        if not init:
+            return None
+        frequency, _sample_format, channels = init
+        channel = pygame.mixer.find_channel(False)
+        if channel is None:
+            return None
+        silence = pygame.mixer.Sound(buffer=bytes(int(frequency * 0.05) * channels * 2))
+
+        # Aufwand des play()-Aufrufs selbst; ab dann liegt der Ton im Mixer
+        call_ms = []
+        for _ in range(trials):
+            channel.stop()
+            start = time.perf_counter()
+            channel.play(silence)
+            call_ms.append((time.perf_counter() - start) * 1000)
+        channel.stop()
+
+        # Weck-Jitter bei laufender Wiedergabe: so lange muss ein Puffer mindestens überbrücken
+        worst = 0.0
+        channel.play(silence, loops=-1)
+        deadline = time.perf_counter() + jitter_window
+        while time.perf_counter() < deadline:
+            before = time.perf_counter()
+            time.sleep(0.001)
+            worst = max(worst, time.perf_counter() - before - 0.001)
+        channel.stop()
+        jitter_ms = worst * 1000
+
+        suggested = next(
+            (size for size in AUDIO_BUFFER_SIZES if size / frequency * 1000 >= 2 * jitter_ms),
+            AUDIO_BUFFER_SIZES[-1],
+        )
+        call_ms.sort()
+        buffer_ms = self.buffer_ms()
+        self.last_probe = {
+            "call_ms": call_ms[len(call_ms) // 2],
+            "buffer_ms": buffer_ms,
+            # Bis der Mixer den Ton abholt, vergeht bis zu ein Puffer; die Ausgabe hält einen weiteren
+            "estimated_ms": call_ms[len(call_ms) // 2] + 2 * buffer_ms,
+            "jitter_ms": jitter_ms,
+            "suggested_buffer": suggested,
+        }
+        return self.last_probe
+
+
+# ====================================================================
+# --- KLASSE: KANAL-MIXER (ÜBERBLENDEN, DUCKING, FADES) ---
+# ====================================================================
+
+JINGLE_CROSSFADE_SECONDS = 1.5
+MATCH_END_FADE_SECONDS = 1.2
+BUZZER_DUCK_LEVEL = 0.3
+
+
+class _MixerTrack:
+    """Ein laufender Jingle: Kanal (None = pygame.mixer.music) und Fade-Pegel."""
+
+    __slots__ = ("channel", "gain", "level", "fading_out")
+
+    def __init__(self, channel, gain=1.0, level=1.0):
+        self.channel = channel
+        self.gain = gain
+        self.level = level
+        self.fading_out = False
+
+    def output(self, duck):
+        volume = max(0.0, min(1.0, self.gain * self.level * duck))
+        if self.channel is None:
+            pygame.mixer.music.set_volume(volume)
+        else:
+            self.channel.set_volume(volume)
+
+    def busy(self):
+        if self.channel is None:
+            return pygame.mixer.music.get_busy()
+        return self.channel.get_busy()
+
+    def stop(self):
+        if self.channel is None:
+            pygame.mixer.music.stop()
+        else:
+            self.channel.stop()
+
+
+class ChannelMixer:
+    """Spielt Jingles auf reservierten Kanälen und fährt Lautstärkerampen.
+
+    Fades und Ducking rechnet ein eigener Audio-Thread in festen Schritten
+    gegen die monotone Uhr, unabhängig davon, wie beschäftigt der Tk-Loop
+    ist. Zwischen Sound-Kanälen wird überblendet; pygame.mixer.music kennt
+    nur einen Stream, zwei gestreamte Jingles wechseln daher ohne Überblendung.
+    """
+
+    def __init__(self, channel_indices=JINGLE_CHANNELS, step=0.005):
+        self.channel_indices = channel_indices
+        self.step = step
+        self.duck_level = 1.0
+        self._channels = []
+        self._tracks = []
+        self._ramps = {}
+        self._cond = threading.Condition(threading.RLock())
+        self._thread = None
+
+    def attach(self):
+        """Übernimmt die reservierten Kanäle, nach jedem (Neu-)Start des Mixers."""
+        with self._cond:
+            self._tracks.clear()
+            self._ramps.clear()
+            self.duck_level = 1.0
+            self._channels = [pygame.mixer.Channel(index) for index in self.channel_indices]
+
+    # --- Wiedergabe ---
+    def _free_channel_locked(self):
+        in_use = {track.channel for track in self._tracks}
+        for channel in self._channels:
+            if channel not in in_use and not channel.get_busy():
+                return channel
+        # Alle belegt: den ältesten Jingle opfern
+        oldest = next((track for track in self._tracks if track.channel is not None), None)
+        if oldest is None:
+            self._channels[0].stop()
+            return self._channels[0]
+        self._drop_locked(oldest)
+        return oldest.channel
+
+    def play_sound(self, sound, gain=1.0, crossfade=0.0):
+        """Startet ``sound`` und blendet laufende Jingles über ``crossfade`` Sekunden aus."""
+        with self._cond:
+            if not self._channels:
+                return None
+            overlap = crossfade > 0 and any(track.busy() for track in self._tracks)
+            self._fade_out_locked(crossfade)
+            channel = self._free_channel_locked()
+            sound.set_volume(gain)
+            track = _MixerTrack(channel, level=0.0 if overlap else 1.0)
+            self._tracks.append(track)
+            track.output(self.duck_level)
+            channel.play(sound)
+            if overlap:
+                self._ramp_locked(track, "level", 1.0, crossfade)
+        return channel
+
+    def play_music(self, path, gain=1.0, start=0.0, crossfade=0.0):
+        """Streamt ``path``; liefert den tatsächlich verwendeten Startversatz."""
+        with self._cond:
+            for track in [track for track in self._tracks if track.channel is None]:
+                self._forget_locked(track)
+            overlap = crossfade > 0 and any(track.busy() for track in self._tracks)
+            self._fade_out_locked(crossfade)
+            track = _MixerTrack(None, gain, level=0.0 if overlap else 1.0)
+
+        pygame.mixer.music.load(path)
+        track.output(self.duck_level)
+        try:
+            pygame.mixer.music.play(start=start)
+        except pygame.error:
+            # Format ohne Suchfunktion: von vorne spielen
+            pygame.mixer.music.play()
+            start = 0.0
+
+        with self._cond:
+            self._tracks.append(track)
+            if overlap:
+                self._ramp_locked(track, "level", 1.0, crossfade)
+        return start
+
+    def is_busy(self):
+        """True, solange der zuletzt gestartete (nicht ausblendende) Jingle läuft."""
+        with self._cond:
+            current = [track for track in self._tracks if not track.fading_out]
+            return bool(current and current[-1].busy())
+
+    def stop(self):
+        with self._cond:
+            for track in list(self._tracks):
+                self._drop_locked(track)
+
+    def fade_out(self, duration, delay=0.0):
+        with self._cond:
+            self._fade_out_locked(duration, delay)
+
+    def duck(self, level=BUZZER_DUCK_LEVEL, attack=0.03):
+        with self._cond:
+            if self._tracks:
+                self._ramp_locked(self, "duck_level", level, attack)
+
+    # --- Interna ---
+    def _fade_out_locked(self, duration, delay=0.0):
+        for track in self._tracks:
+            if track.fading_out:
+                continue
+            track.fading_out = True
+            if duration <= 0 and delay <= 0:
+                track.stop()
+            else:
+                self._ramp_locked(track, "level", 0.0, duration, delay, on_done=track.stop)
+        if duration <= 0 and delay <= 0:
+            self._prune_locked()
+
+    def _forget_locked(self, track):
+        if track in self._tracks:
+            self._tracks.remove(track)
+        self._ramps.pop((id(track), "level"), None)
+        if not self._tracks:
+            # Ducking endet mit dem letzten Jingle (nach der Hupe wird ausgeblendet)
+            self._ramps.pop((id(self), "duck_level"), None)
+            self.duck_level = 1.0
+
+    def _drop_locked(self, track):
+        track.stop()
+        self._forget_locked(track)
+
+    def _prune_locked(self):
+        for track in [track for track in self._tracks if track.fading_out and not track.busy()]:
+            self._forget_locked(track)
+
+    def _ramp_locked(self, target, attr, value, duration, delay=0.0, on_done=None):
+        # Startwert wird erst bei Beginn der Rampe gelesen (None), damit Verzögerungen passen
+        self._ramps[(id(target), attr)] = [target, attr, time.monotonic() + delay, duration, None, value, on_done]
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._ramps:
+                    self._cond.wait()
+                now = time.monotonic()
+                finished = []
+                for key, ramp in list(self._ramps.items()):
+                    target, attr, start, duration, begin, value, on_done = ramp
+                    if now < start:
+                        continue
+                    if begin is None:
+                        begin = ramp[4] = getattr(target, attr)
+                    progress = 1.0 if duration <= 0 else min(1.0, (now - start) / duration)
+                    setattr(target, attr, begin + (value - begin) * progress)
+                    if progress >= 1.0:
+                        del self._ramps[key]
+                        if on_done is not None:
+                            finished.append(on_done)
+                for track in self._tracks:
+                    track.output(self.duck_level)
+                for callback in finished:
+                    callback()
+                self._prune_locked()
+            time.sleep(self.step)
+
+
+# ====================================================================
+# --- KLASSE: JINGLE-POOL (VORDEKODIERT) ---
+# ====================================================================
+
+class JinglePool:
+    """Dekodiert ausgewählte Jingles im Hintergrund zu pygame.mixer.Sound-Objekten.
+
+    Sounds aus dem Pool starten ohne Ladezeit über den ChannelMixer. Dateien,
+    die nicht mehr ins Speicherbudget passen, bleiben draußen und werden wie
+    bisher über pygame.mixer.music gestreamt.
+    """
+
+    def __init__(self, budget_bytes=64 * 1024 * 1024, transcoder=None):
+        self.budget_bytes = budget_bytes
+        self.transcoder = transcoder
+        self._sounds = {}
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        # Ein zusätzlicher Platz außerhalb des Budgets für den vorab gewählten Auto-Jingle
+        self._prefetched = None
+        self._prefetch_token = 0
+        # Je Pfad höchstens eine ab einem Startversatz gekürzte Kopie
+        self._trimmed = {}
+
+    @property
+    def used_bytes(self):
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def clear(self):
+        """Verwirft alle Sounds, z. B. bevor der Mixer neu gestartet wird."""
+        with self._lock:
+            self._generation += 1
+            self._prefetch_token += 1
+            self._sounds.clear()
+            self._sizes.clear()
+            self._trimmed.clear()
+            self._prefetched = None
+
+    @staticmethod
+    def _estimate_decoded_bytes(path):
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        bytes_per_sample = abs(sample_format) // 8
+        with open(path, "rb") as fh:
+            duration = read_wav_info(fh).duration
+        return int(duration * frequency * channels * bytes_per_sample)
+
+    def preload(self, paths):
+        """Ersetzt den Poolinhalt durch ``paths`` und dekodiert im Hintergrund."""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            wanted = set(paths)
+            for path in list(self._sounds):
+                if path not in wanted:
+                    del self._sounds[path]
+                    del self._sizes[path]
+            # Budget verkleinert: zuletzt geladene Sounds zuerst verwerfen
+            while self._sounds and sum(self._sizes.values()) > self.budget_bytes:
+                path = next(reversed(self._sounds))
+                del self._sounds[path]
+                del self._sizes[path]
+            self._trimmed = {path: entry for path, entry in self._trimmed.items() if path in self._sounds}
+        threading.Thread(target=self._preload_thread, args=(list(paths), generation), daemon=True).start()
+
+    def _preload_thread(self, paths, generation):
+        if not pygame.mixer.get_init():
+            return
+        for path in paths:
+            with self._lock:
+                if generation != self._generation:
+                    return
+                if path in self._sounds:
+                    continue
+                remaining = self.budget_bytes - sum(self._sizes.values())
+            try:
+                size = self._estimate_decoded_bytes(path)
+                if size > remaining:
+                    # Wird gestreamt, aber zumindest im Mixer-Format vorbereitet
+                    if self.transcoder is not None:
+                        self.transcoder.ensure(path)
+                    continue
+                sound = self._load_sound(path)
+            except Exception:
+                continue
+            with self._lock:
+                if generation != self._generation:
+                    return
+                self._sounds[path] = sound
+                self._sizes[path] = size
+
+    def prefetch(self, path):
+        """Dekodiert ``path`` synchron (Aufruf aus einem Hintergrund-Thread), notfalls am Budget vorbei."""
+        with self._lock:
+            if path in self._sounds or (self._prefetched and self._prefetched[0] == path):
+                return True
+            token = self._prefetch_token
+        if not pygame.mixer.get_init():
+            return False
+        try:
+            sound = self._load_sound(path)
+        except Exception:
+            return False
+        with self._lock:
+            if token != self._prefetch_token:
+                return False
+            self._prefetched = (path, sound)
+        return True
+
+    def _load_sound(self, path):
+        if self.transcoder is not None:
+            self.transcoder.ensure(path)
+            sound = self.transcoder.load_sound(path)
+            if sound is not None:
+                return sound
+        return pygame.mixer.Sound(path)
+
+    def cancel_prefetch(self):
+        with self._lock:
+            self._prefetch_token += 1
+            self._prefetched = None
+            self._trimmed = {path: entry for path, entry in self._trimmed.items() if path in self._sounds}
+
+    def _lookup_locked(self, path):
+        sound = self._sounds.get(path)
+        if sound is None and self._prefetched and self._prefetched[0] == path:
+            sound = self._prefetched[1]
+        return sound
+
+    def has(self, path):
+        with self._lock:
+            return self._lookup_locked(path) is not None
+
+    def get_length(self, path):
+        with self._lock:
+            sound = self._lookup_locked(path)
+        return sound.get_length() if sound else 0
+
+    def _trimmed_sound(self, path, sound, start):
+        """Kopie von ``sound`` ab ``start`` Sekunden (geschnittener Puffer, wird wiederverwendet)."""
+        start = round(start, 3)
+        with self._lock:
+            cached = self._trimmed.get(path)
+        if cached and cached[0] == start and cached[1] is sound:
+            return cached[2]
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        raw = sound.get_raw()
+        offset = min(len(raw), int(start * frequency) * (abs(sample_format) // 8) * channels)
+        trimmed = pygame.mixer.Sound(buffer=memoryview(raw)[offset:])
+        with self._lock:
+            self._trimmed[path] = (start, sound, trimmed)
+        return trimmed
+
+    def sound_for(self, path, start=0.0):
+        """Sound für ``path`` ab ``start`` Sekunden oder None (nicht im Pool)."""
+        with self._lock:
+            sound = self._lookup_locked(path)
+        if sound is not None and start > 0:
+            sound = self._trimmed_sound(path, sound, start)
+        return sound
+
+
+# ====================================================================
+# --- KLASSE: JINGLE-BIBLIOTHEK (SQLITE-KATALOG) ---
+# ====================================================================
+
+LIBRARY_AUDIO_EXTENSIONS = (".wav",)
+LIBRARY_RESCAN_MS = 60 * 1000
+
+
+class JingleLibrary:
+    """Katalog aller Jingles aus überwachten Ordnern, abgelegt als SQLite-Datenbank.
+
+    Ein Scan liest nur Verzeichniseinträge; analysiert werden ausschließlich
+    neue oder geänderte Dateien (Größe/Änderungszeit), parallel im Hintergrund.
+    Kategorie ist der erste Unterordner, alle Ordnernamen werden als Tags
+    indiziert, sodass eine Auswahl auch bei tausenden Dateien sofort steht.
+    Nicht lesbare Dateien werden mit Größe/Änderungszeit vermerkt und erst
+    nach einer Änderung erneut versucht; Einträge eines gerade fehlenden
+    Ordners (z.B. abgezogener USB-Stick) bleiben erhalten.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY,
+            folder TEXT NOT NULL,
+            category TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            duration REAL,
+            format TEXT,
+            loudness REAL,
+            audible_start REAL,
+            loudest_start REAL,
+            envelope TEXT
+        );
+        CREATE INDEX IF NOT EXISTS files_category ON files (category);
+        CREATE TABLE IF NOT EXISTS tags (
+            tag TEXT NOT NULL,
+            path TEXT NOT NULL,
+            PRIMARY KEY (tag, path)
+        );
+        CREATE INDEX IF NOT EXISTS tags_path ON tags (path);
+        CREATE TABLE IF NOT EXISTS failures (
+            path TEXT PRIMARY KEY,
+            folder TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            error TEXT
+        );
+    """
+
+    def __init__(self, root, db_path, analyze_fn, max_workers=2, batch_size=50):
+        self.root = root
+        self.db_path = Path(db_path)
+        self.analyze_fn = analyze_fn
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn = None
+        self._scan_token = 0
+        self.scanning = False
+
+    def _connect(self):
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(self.SCHEMA)
+        return self._conn
+
+    @staticmethod
+    def describe_format(info):
+        kind = "Float" if info.format_tag == WAVE_FORMAT_IEEE_FLOAT else "PCM"
+        layout = {1: "mono", 2: "stereo"}.get(info.channels, f"{info.channels} Kanäle")
+        return f"{kind} {info.sampwidth * 8} Bit, {info.sample_rate} Hz, {layout}"
+
+    @staticmethod
+    def _classify(folder, path):
+        """Kategorie (erster Unterordner bzw. Ordnername) und Tags (alle Ordnernamen)."""
+        parts = Path(os.path.relpath(os.path.dirname(path), folder)).parts
+        parts = [part for part in parts if part not in (".", "")]
+        category = parts[0] if parts else os.path.basename(folder.rstrip(os.sep)) or folder
+        tags = {part.lower() for part in [os.path.basename(folder.rstrip(os.sep)), *parts] if part}
+        return category, sorted(tags)
+
+    @staticmethod
+    def _walk(folder):
+        stack = [folder]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.lower().endswith(LIBRARY_AUDIO_EXTENSIONS):
+                            stat = entry.stat()
+                            yield entry.path, stat.st_size, stat.st_mtime_ns
+            except OSError:
+                continue
+
+    def scan(self, folders, on_progress=None, on_done=None):
+        """Startet einen inkrementellen Scan; ein neuer Scan löst den laufenden ab.
+
+        ``on_progress(done, total)`` und ``on_done(stats)`` laufen im Tk-Thread.
+        """
+        self._scan_token += 1
+        self.scanning = True
+        threading.Thread(
+            target=self._scan_thread,
+            args=(list(folders), self._scan_token, on_progress, on_done),
+            daemon=True,
+        ).start()
+
+    def cancel_scan(self):
+        self._scan_token += 1
+        self.scanning = False
+
+    def _scan_thread(self, folders, token, on_progress, on_done):
+        found = {}
+        unavailable = set()
+        for folder in folders:
+            folder = os.path.abspath(folder)
+            if not os.path.isdir(folder):
+                unavailable.add(folder)
+                continue
+            for path, size, mtime_ns in self._walk(folder):
+                found[path] = (folder, size, mtime_ns)
+
+        with self._lock:
+            conn = self._connect()
+            known = {}
+            for table in ("files", "failures"):
+                for path, folder, size, mtime_ns in conn.execute(f"SELECT path, folder, size, mtime_ns FROM {table}"):
+                    known[path] = (folder, size, mtime_ns)
+            # Fehlt ein Ordner nur vorübergehend, bleiben seine Einträge stehen
+            removed = [(path,) for path, (folder, _size, _mtime) in known.items() if path not in found and folder not in unavailable]
+            conn.executemany("DELETE FROM files WHERE path = ?", removed)
+            conn.executemany("DELETE FROM tags WHERE path = ?", removed)
+            conn.executemany("DELETE FROM failures WHERE path = ?", removed)
+            conn.commit()
+
+        changed = [path for path, entry in found.items() if known.get(path) != entry]
+        total = len(changed)
+        done = 0
+        failed = 0
+        batch = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(self._analyze_file, path, found[path], token) for path in changed]
+            for future in as_completed(futures):
+                done += 1
+                row = future.result()
+                if row is not None:
+                    batch.append(row)
+                    failed += row[0] is None
+                if token != self._scan_token:
+                    continue
+                if len(batch) >= self.batch_size:
+                    self._store(batch)
+                    batch = []
+                    if on_progress:
+                        self.root.after(0, self._deliver, token, on_progress, done, total)
+
+        if token != self._scan_token:
+            return
+        if batch:
+            self._store(batch)
+        stats = {
+            "files": len(found),
+            "analyzed": total,
+            "failed": failed,
+            "removed": len(removed),
+            "unavailable": sorted(unavailable),
+        }
+        self.root.after(0, self._finish_scan, token, on_done, stats)
+
+    def _analyze_file(self, path, found_entry, token):
+        if token != self._scan_token:
+            return None
+        folder, size, mtime_ns = found_entry
+        try:
+            with open(path, "rb") as fh:
+                file_format = self.describe_format(read_wav_info(fh))
+            entry = self.analyze_fn(path)
+            if not entry.get("duration"):
+                raise ValueError("Datei konnte nicht dekodiert werden")
+        except Exception as exc:
+            # Fehlschlag merken, damit die Datei erst nach einer Änderung erneut drankommt
+            return None, (path, folder, size, mtime_ns, str(exc))
+        category, tags = self._classify(folder, path)
+        envelope = entry.get("envelope")
+        return (
+            (path, folder, category, size, mtime_ns, entry.get("duration"), file_format, entry.get("loudness"),
+             entry.get("audible_start"), entry.get("loudest_start"), json.dumps(envelope) if envelope else None),
+            tags,
+        )
+
+    def _store(self, rows):
+        stored = [(row, tags) for row, tags in rows if row is not None]
+        failures = [failure for row, failure in rows if row is None]
+        with self._lock:
+            conn = self._connect()
+            conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", [row for row, _tags in stored])
+            conn.executemany("DELETE FROM tags WHERE path = ?", [(row[0],) for row, _tags in stored])
+            conn.executemany("INSERT OR IGNORE INTO tags VALUES (?, ?)", [(tag, row[0]) for row, tags in stored for tag in tags])
+            conn.executemany("DELETE FROM failures WHERE path = ?", [(row[0],) for row, _tags in stored])
+            # Eine vormals lesbare Datei, die jetzt scheitert, fällt aus dem Katalog
+            conn.executemany("DELETE FROM files WHERE path = ?", [(failure[0],) for failure in failures])
+            conn.executemany("DELETE FROM tags WHERE path = ?", [(failure[0],) for failure in failures])
+            conn.executemany("INSERT OR REPLACE INTO failures VALUES (?, ?, ?, ?, ?)", failures)
+            conn.commit()
+
+    def _deliver(self, token, callback, *args):
+        if token == self._scan_token:
+            callback(*args)
+
+    def _finish_scan(self, token, on_done, stats):
+        if token != self._scan_token:
+            return
+        self.scanning = False
+        if on_done:
+            on_done(stats)
+
+    def _query(self, sql, params=()):
+        try:
+            with self._lock:
+                return self._connect().execute(sql, params).fetchall()
+        except sqlite3.Error:
+            return []
+
+    def categories(self):
+        """Liste ``(kategorie, anzahl)``, alphabetisch."""
+        return self._query("SELECT category, COUNT(*) FROM files GROUP BY category ORDER BY category COLLATE NOCASE")
+
+    def paths_for_categories(self, categories):
+        if not categories:
+            return []
+        marks = ", ".join("?" * len(categories))
+        rows = self._query(f"SELECT path FROM files WHERE category IN ({marks}) ORDER BY path", tuple(categories))
+        return [path for (path,) in rows]
+
+    def paths_for_tag(self, tag):
+        rows = self._query("SELECT path FROM tags WHERE tag = ? ORDER BY path", (tag.lower(),))
+        return [path for (path,) in rows]
+
+    def file_count(self):
+        rows = self._query("SELECT COUNT(*) FROM files")
+        return rows[0][0] if rows else 0
+
+    def get_entry(self, path):
+        """Analysewerte im Format der Peak-Cache-Einträge, sofern die Datei unverändert ist."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        rows = self._query(
+            "SELECT duration, loudness, audible_start, loudest_start, envelope FROM files "
+            "WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (os.path.abspath(path), stat.st_size, stat.st_mtime_ns),
+        )
+        if not rows:
+            return None
+        duration, loudness, audible_start, loudest_start, envelope = rows[0]
+        return {
+            "duration": duration or 0,
+            "envelope": json.loads(envelope) if envelope else None,
+            "loudness": loudness,
+            "audible_start": audible_start or 0.0,
+            "loudest_start": loudest_start or 0.0,
+        }
+
+
 # ====================================================================
 # --- KLASSE: ANZEIGETAFEL-FENSTER (BLAU-WEISS, OHNE STATUS) ---
 # ====================================================================
 
+# Obergrenzen der Schrift-Caches der Anzeigetafel (Einträge)
+SCOREBOARD_TEXT_WIDTH_CACHE = 4096
+SCOREBOARD_FITTED_SIZE_CACHE = 512
+
+
 class ScoreboardDisplay:
     """Repräsentiert das separate Anzeigetafel-Fenster mit blau-weißem Schema."""
 
@@ -82,6 +1834,19 @@ class ScoreboardDisplay:
         self.team_home_name_raw = home_name
         self.team_away_name_raw = away_name
 
+        # Zuletzt gerenderter Zustand je Widget-Eigenschaft (Dirty-Checking)
+        self._rendered = {}
+        self.applied_updates = 0
+        self.skipped_updates = 0
+
+        # Font-Caches für die Teamnamen: Font-Objekte je (Familie, Größe, Gewicht),
+        # gemessene Textbreiten und die passende Größe je (Name, Umbruchbreite).
+        # Breiten und Größen sind LRU-begrenzt, ein Turniertag bringt viele Namen
+        self._team_font_size = 18
+        self._fonts = {}
+        self._text_widths = OrderedDict()
+        self._fitted_sizes = OrderedDict()
+
         self.create_widgets()
         self.window.withdraw()
 
@@ -149,11 +1914,46 @@ class ScoreboardDisplay:
         self.lbl_time.pack()
         self._update_wrapped_team_names()
 
+        # --- TABELLE (ÜBERLAGERT DIE SPIELANZEIGE ZWISCHEN DEN SPIELEN) ---
+        self.standings_title = tk.StringVar(value="TABELLE")
+        self.standings_text = tk.StringVar(value="")
+        self.standings_frame = tk.Frame(self.window, bg=self.bg_color, padx=14, pady=14)
+        self.lbl_standings_title = tk.Label(self.standings_frame, textvariable=self.standings_title, font=("Helvetica", 24, "bold"), bg=self.bg_color, fg=self.text_color)
+        self.lbl_standings_title.pack(pady=(0, 8))
+        self.lbl_standings = tk.Label(
+            self.standings_frame,
+            textvariable=self.standings_text,
+            font=("Courier", 18, "bold"),
+            bg=self.bg_color,
+            fg=self.text_color,
+            justify="left",
+            anchor="n",
+        )
+        self.lbl_standings.pack(fill="both", expand=True)
+
+    def show_standings(self, title, lines):
+        self._render_var("standings_title", self.standings_title, title)
+        self._render_var("standings", self.standings_text, "\n".join(lines))
+        if not self.standings_visible():
+            self.standings_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
+            self.standings_frame.lift()
+
+    def hide_standings(self):
+        if self.standings_visible():
+            self.standings_frame.place_forget()
+
+    def standings_visible(self):
+        return bool(self.standings_frame.place_info())
+
     def update(self, time_str, half_text, home_score, away_score, time_color):
-        """Aktualisiert alle Anzeigewerte ohne Statuszeile."""
-        self.time_str.set(time_str)
-        self.home_score_str.set(str(home_score))
-        self.away_score_str.set(str(away_score))
+        """Aktualisiert alle Anzeigewerte ohne Statuszeile.
+
+        Es werden nur Widgets angefasst, deren Text oder Farbe sich seit dem
+        letzten Rendern geändert hat.
+        """
+        self._render_var("time", self.time_str, time_str)
+        self._render_var("home_score", self.home_score_str, str(home_score))
+        self._render_var("away_score", self.away_score_str, str(away_score))
 
         if time_color == self.bg_color:
             time_fg = self.text_color
@@ -162,18 +1962,37 @@ class ScoreboardDisplay:
         else:
             time_fg = time_color
 
-        self.lbl_time.config(fg=time_fg)
-        self.lbl_time_title.config(fg=ACCENT_RED if time_fg == ACCENT_RED else self.text_color)
+        self._render_fg("time_fg", self.lbl_time, time_fg)
+        self._render_fg("time_title_fg", self.lbl_time_title, ACCENT_RED if time_fg == ACCENT_RED else self.text_color)
         
         if home_score > away_score:
-            self.lbl_score_home.config(fg=self.text_color)
-            self.lbl_score_away.config(fg="#88AAFF")
+            home_fg, away_fg = self.text_color, "#88AAFF"
         elif away_score > home_score:
-            self.lbl_score_home.config(fg="#88AAFF")
-            self.lbl_score_away.config(fg=self.text_color)
+            home_fg, away_fg = "#88AAFF", self.text_color
         else:
-            self.lbl_score_home.config(fg=self.text_color)
-            self.lbl_score_away.config(fg=self.text_color)
+            home_fg, away_fg = self.text_color, self.text_color
+        self._render_fg("score_home_fg", self.lbl_score_home, home_fg)
+        self._render_fg("score_away_fg", self.lbl_score_away, away_fg)
+
+    def _render_var(self, key, var, value):
+        if self._rendered.get(key) == value:
+            self.skipped_updates += 1
+            return
+        var.set(value)
+        self._rendered[key] = value
+        self.applied_updates += 1
+
+    def _render_fg(self, key, widget, color):
+        if self._rendered.get(key) == color:
+            self.skipped_updates += 1
+            return
+        widget.config(fg=color)
+        self._rendered[key] = color
+        self.applied_updates += 1
+
+    def get_render_stats(self):
+        """Anzahl ausgeführter und übersprungener Widget-Aktualisierungen."""
+        return {"applied": self.applied_updates, "skipped": self.skipped_updates}
 
     def show(self):
         self.window.deiconify()
@@ -191,8 +2010,10 @@ class ScoreboardDisplay:
     def set_colors(self, bg_color, text_color):
         self.bg_color = bg_color
         self.text_color = text_color
-        for widget in [self.window, self.main_frame, self.title_frame, self.home_frame, self.away_frame, self.time_frame]:
+        for widget in [self.window, self.main_frame, self.title_frame, self.home_frame, self.away_frame, self.time_frame, self.standings_frame]:
             widget.configure(bg=self.bg_color)
+        self.lbl_standings_title.configure(bg=self.bg_color, fg=self.text_color)
+        self.lbl_standings.configure(bg=self.bg_color, fg=self.text_color)
         self.lbl_title.configure(bg=self.bg_color, fg=self.text_color)
         self.lbl_home_team.configure(bg=self.bg_color, fg=self.text_color)
         self.lbl_away_team.configure(bg=self.bg_color, fg=self.text_color)
@@ -201,6 +2022,8 @@ class ScoreboardDisplay:
         self.lbl_time.configure(bg=self.bg_color, fg=self.text_color)
         self.lbl_time_title.configure(bg=self.bg_color, fg=self.text_color)
         self.lbl_divider.configure(bg=self.bg_color)
+        for key in ("time_fg", "time_title_fg", "score_home_fg", "score_away_fg"):
+            self._rendered[key] = self.text_color
 
     def set_team_names(self, home, away):
         self.team_home_name_raw = home
@@ -220,35 +2043,77 @@ class ScoreboardDisplay:
         self.board_title.set(title)
         self.window.title(f"Anzeigetafel - {title}")
 
+    def _get_font(self, family, size, weight):
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = tkfont.Font(family=family, size=size, weight=weight)
+            self._fonts[key] = font
+        return font
+
+    @staticmethod
+    def _cache_lookup(cache, key):
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _cache_store(cache, key, value, limit):
+        cache[key] = value
+        if len(cache) > limit:
+            cache.popitem(last=False)
+
+    def _measure_team_text(self, size, text):
+        key = (size, text)
+        width = self._cache_lookup(self._text_widths, key)
+        if width is None:
+            width = self._get_font("Arial", size, "bold").measure(text)
+            self._cache_store(self._text_widths, key, width, SCOREBOARD_TEXT_WIDTH_CACHE)
+        return width
+
+    def _team_name_fits(self, name, size, wrap_len):
+        longest_word = max((self._measure_team_text(size, word) for word in name.split()), default=0)
+        est_lines = (self._measure_team_text(size, name) // max(1, wrap_len)) + 1
+        return longest_word <= wrap_len and est_lines <= 3
+
+    def _fit_team_name_size(self, name, wrap_len, min_size, max_size):
+        key = (name, wrap_len)
+        size = self._cache_lookup(self._fitted_sizes, key)
+        if size is not None:
+            return size
+
+        # Textbreite wächst monoton mit der Schriftgröße -> binäre Suche
+        low, high = min_size, max_size
+        size = min_size
+        while low <= high:
+            mid = (low + high) // 2
+            if self._team_name_fits(name, mid, wrap_len):
+                size = mid
+                low = mid + 1
+            else:
+                high = mid - 1
+
+        self._cache_store(self._fitted_sizes, key, size, SCOREBOARD_FITTED_SIZE_CACHE)
+        return size
+
     def _sync_team_font_size(self):
         wrap_len = int(self.lbl_home_team.cget("wraplength")) or 240
         names = [self.team_home_name_raw, self.team_away_name_raw]
         max_size = 26
         min_size = 14
 
-        for size in range(max_size, min_size - 1, -1):
-            font = tkfont.Font(family="Arial", size=size, weight="bold")
-            fits_all = True
-            for name in names:
-                if not name:
-                    continue
-                longest_word = max((font.measure(word) for word in name.split()), default=0)
-                est_lines = (font.measure(name) // max(1, wrap_len)) + 1
-                if longest_word > wrap_len or est_lines > 3:
-                    fits_all = False
-                    break
-            if fits_all:
-                self.lbl_home_team.configure(font=("Arial", size, "bold"))
-                self.lbl_away_team.configure(font=("Arial", size, "bold"))
-                self._update_wrapped_team_names()
-                return
-
-        self.lbl_home_team.configure(font=("Arial", min_size, "bold"))
-        self.lbl_away_team.configure(font=("Arial", min_size, "bold"))
+        size = min(
+            (self._fit_team_name_size(name, wrap_len, min_size, max_size) for name in names if name),
+            default=max_size,
+        )
+        if size != self._team_font_size:
+            self._team_font_size = size
+            self.lbl_home_team.configure(font=("Arial", size, "bold"))
+            self.lbl_away_team.configure(font=("Arial", size, "bold"))
         self._update_wrapped_team_names()
 
     def _format_team_name_lines(self, name, wrap_len):
-        font = tkfont.Font(font=self.lbl_home_team["font"])
         words = name.split()
         if not words:
             return [""]
@@ -256,30 +2121,1120 @@ class ScoreboardDisplay:
         lines = []
         current = words[0]
 
-        for word in words[1:]:
-            trial = f"{current} {word}"
-            if font.measure(trial) <= wrap_len:
-                current = trial
-            else:
-                lines.append(current)
-                current = word
+        for word in words[1:]:
+            trial = f"{current} {word}"
+            if self._measure_team_text(self._team_font_size, trial) <= wrap_len:
+                current = trial
+            else:
+                lines.append(current)
+                current = word
+
+        lines.append(current)
+        return lines[:3]
+
+    def _update_wrapped_team_names(self):
+        wrap_len = int(self.lbl_home_team.cget("wraplength")) or 240
+        home_lines = self._format_team_name_lines(self.team_home_name_raw, wrap_len)
+        away_lines = self._format_team_name_lines(self.team_away_name_raw, wrap_len)
+
+        line_count = max(len(home_lines), len(away_lines), self.lbl_home_team.cget("height"))
+        while len(home_lines) < line_count:
+            home_lines.append("")
+        while len(away_lines) < line_count:
+            away_lines.append("")
+
+        self.team_home_name.set("\n".join(home_lines))
+        self.team_away_name.set("\n".join(away_lines))
+
+
+# Auto-Jingle wird so viele Sekunden vor der letzten Minute ausgewählt und vorbereitet
+JINGLE_PREFETCH_LEAD_SECONDS = 90
+JINGLE_START_MODES = {
+    "anfang": None,
+    "ton": "audible_start",
+    "lautester": "loudest_start",
+}
+
+
+# ====================================================================
+# --- KLASSE: SPIELUHR (MONOTON, DRIFTFREI) ---
+# ====================================================================
+
+class MatchClock:
+    """Spieluhr auf Basis von time.monotonic()-Ankern.
+
+    Die Spielzeit wird nicht pro Tick aufaddiert, sondern immer aus dem
+    Startanker berechnet. Verspätete Tk-Callbacks verschieben dadurch nur
+    die Anzeige, nicht die Zeit selbst.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._base = 0.0
+        self._anchor = None
+
+    @property
+    def running(self):
+        return self._anchor is not None
+
+    def start(self):
+        if self._anchor is None:
+            self._anchor = self._clock()
+
+    def pause(self):
+        if self._anchor is not None:
+            self._base += self._clock() - self._anchor
+            self._anchor = None
+
+    def set_elapsed(self, seconds):
+        """Setzt die Spielzeit (Reset, Halbzeitwechsel), ohne den Laufzustand zu ändern."""
+        self._base = float(seconds)
+        if self._anchor is not None:
+            self._anchor = self._clock()
+
+    def elapsed(self):
+        if self._anchor is None:
+            return self._base
+        return self._base + (self._clock() - self._anchor)
+
+    def whole_seconds(self):
+        return int(self.elapsed())
+
+    def deadline_for(self, seconds):
+        """Zeitpunkt der Uhrquelle, an dem die Spielzeit ``seconds`` erreicht (None, wenn angehalten)."""
+        if self._anchor is None:
+            return None
+        return self._anchor + (seconds - self._base)
+
+    def ms_until_next_second(self):
+        """Wartezeit bis zur nächsten vollen Sekunde (plus 1 ms Puffer gegen Abrunden)."""
+        elapsed = self.elapsed()
+        remaining = (math.floor(elapsed) + 1) - elapsed
+        return max(1, int(math.ceil(remaining * 1000)) + 1)
+
+
+# ====================================================================
+# --- KLASSE: HUPEN-ZEITPLANUNG (SPIELENDE) ---
+# ====================================================================
+
+class BuzzerScheduler:
+    """Löst die Hupe zum exakten Spielende aus, unabhängig vom Tk-Loop.
+
+    Ein Hintergrund-Thread schläft bis kurz vor die Frist und wartet den Rest
+    in kurzen Schritten ab; Sound und reservierter Kanal liegen dabei schon
+    bereit. Frist und tatsächlicher Auslösezeitpunkt werden festgehalten.
+    Hauptuhr und Mehrfeld-Betrieb teilen sich den Hupen-Kanal: läuft dort
+    noch eine Hupe, wird die nächste dahinter eingereiht statt sie abzuschneiden.
+    """
+
+    SPIN_SECONDS = 0.02
+    # Gemeinsam für alle Planer, die denselben Kanal bespielen
+    _channel_lock = threading.Lock()
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cancel_event = None
+        self.deadline = None
+        self.fired = None
+
+    def arm(self, deadline, channel, sound, on_fire=None):
+        """Plant die Hupe für ``deadline``; ``on_fire(deadline, fired_at)`` läuft im Hupen-Thread."""
+        with self._lock:
+            if self._cancel_event is not None:
+                self._cancel_event.set()
+            cancel_event = self._cancel_event = threading.Event()
+            self.deadline = deadline
+            self.fired = None
+        threading.Thread(target=self._wait, args=(cancel_event, deadline, channel, sound, on_fire), daemon=True).start()
+
+    def cancel(self):
+        """Hebt die Planung auf; liefert ``(deadline, fired_at)``, falls die Hupe schon lief.
+
+        Auslösen und Abbrechen sind über die Sperre gegeneinander atomar: ist
+        das Ergebnis None, spielt der Hupen-Thread garantiert nicht mehr.
+        """
+        with self._lock:
+            if self._cancel_event is not None:
+                self._cancel_event.set()
+            fired = self.fired
+            self._cancel_event = None
+            self.deadline = None
+            self.fired = None
+        return fired
+
+    @property
+    def armed(self):
+        return self._cancel_event is not None and self.fired is None
+
+    def _wait(self, cancel_event, deadline, channel, sound, on_fire):
+        while True:
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                break
+            # Grob schlafen, die letzten Millisekunden in kurzen Schritten
+            wait = remaining - self.SPIN_SECONDS if remaining > 2 * self.SPIN_SECONDS else 0.0005
+            if cancel_event.wait(wait):
+                return
+        with self._lock:
+            if cancel_event.is_set():
+                return
+            try:
+                self._play_or_queue(channel, sound)
+            except Exception:
+                return
+            fired_at = self._clock()
+            self.fired = (deadline, fired_at)
+        if on_fire is not None:
+            on_fire(deadline, fired_at)
+
+    @classmethod
+    def _play_or_queue(cls, channel, sound):
+        with cls._channel_lock:
+            if channel.get_busy():
+                channel.queue(sound)
+            else:
+                channel.play(sound)
+
+
+# ====================================================================
+# --- KLASSE: WELLENFORM-ANZEIGE (CANVAS) ---
+# ====================================================================
+
+class WaveformRenderer:
+    """Zeichnet die Jingle-Wellenform mit einmal angelegten Canvas-Balken.
+
+    Bei neuen Daten oder Größenänderung werden nur coords/itemconfig der
+    vorhandenen Elemente angepasst. <Configure>-Ereignisse werden auf
+    höchstens ein Neuzeichnen pro Frame zusammengefasst.
+    """
+
+    FRAME_MS = 16
+    MAX_BARS = 600
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._bars = []
+        self._bar_colors = []
+        self._source = None
+        self._values = []
+        self._scale = 1.0
+        self._geometry = None
+        self._message_id = None
+        self._pending_redraw = None
+        self._playhead_id = None
+        self._playhead_fraction = None
+        self._playhead_x = None
+
+    @staticmethod
+    def _color_for(val_amp):
+        if val_amp < 0.15: return "#DDD"
+        elif val_amp < 0.30: return ACCENT_GREEN
+        elif val_amp < 0.60: return "#ffc107"
+        return ACCENT_RED
+
+    def set_data(self, source, scale=1.0):
+        """``source`` ist eine WaveEnvelope (Balkenzahl folgt der Breite) oder eine Werteliste."""
+        if not source:
+            self.clear()
+            return
+        self._source = source
+        self._values = [] if isinstance(source, WaveEnvelope) else list(source)
+        self._scale = scale if scale > 0 else 1.0
+        self._geometry = None
+        self._hide_message()
+        self.canvas.itemconfigure("wavebar", state="normal")
+        self.redraw()
+
+    def _sync_values(self, width):
+        if isinstance(self._source, WaveEnvelope):
+            count = max(1, min(self.MAX_BARS, width, len(self._source)))
+            if count != len(self._values):
+                self._values = self._source.peaks(count)
+
+        count = len(self._values)
+        while len(self._bars) < count:
+            self._bars.append(self.canvas.create_rectangle(0, 0, 0, 0, outline="", fill="#DDD", tags="wavebar"))
+            self._bar_colors.append("#DDD")
+        if len(self._bars) > count:
+            for item in self._bars[count:]:
+                self.canvas.delete(item)
+            del self._bars[count:]
+            del self._bar_colors[count:]
+
+    def redraw(self):
+        if self._pending_redraw is not None:
+            self.canvas.after_cancel(self._pending_redraw)
+            self._pending_redraw = None
+        if not self._source:
+            return
+
+        w = self.canvas.winfo_width()
+        h = self.canvas.winfo_height()
+        geometry = (w, h)
+        if geometry == self._geometry:
+            return
+        self._geometry = geometry
+        self._sync_values(w)
+        if not self._values:
+            return
+
+        mid = h / 2
+        bar_w = w / len(self._values)
+        for i, val in enumerate(self._values):
+            val_amp = min(1.0, val / self._scale)
+            bar_h = val_amp * (h / 2) * 0.90
+            item = self._bars[i]
+            self.canvas.coords(item, i * bar_w, mid - bar_h, (i * bar_w) + bar_w, mid + bar_h)
+            color = self._color_for(val_amp)
+            if color != self._bar_colors[i]:
+                self.canvas.itemconfigure(item, fill=color)
+                self._bar_colors[i] = color
+        if self._playhead_fraction is not None:
+            self.set_playhead(self._playhead_fraction)
+        self.canvas.tag_raise("playhead")
+
+    def set_playhead(self, fraction):
+        """Verschiebt die eine Abspielmarke; unveränderte Pixelposition wird übersprungen."""
+        self._playhead_fraction = fraction
+        w = self.canvas.winfo_width()
+        x = int(round(max(0.0, min(1.0, fraction)) * w))
+        if self._playhead_id is None:
+            self._playhead_id = self.canvas.create_line(x, 0, x, 200, fill=RSK_BLUE, width=3, tags="playhead")
+        elif x == self._playhead_x:
+            return
+        else:
+            self.canvas.coords(self._playhead_id, x, 0, x, 200)
+            self.canvas.itemconfigure(self._playhead_id, state="normal")
+        self._playhead_x = x
+
+    def hide_playhead(self):
+        self._playhead_fraction = None
+        self._playhead_x = None
+        if self._playhead_id is not None:
+            self.canvas.itemconfigure(self._playhead_id, state="hidden")
+
+    def ms_per_pixel(self, duration):
+        w = max(1, self.canvas.winfo_width())
+        return duration * 1000.0 / w
+
+    def request_redraw(self):
+        """Fasst Größenänderungen zusammen: höchstens ein Neuzeichnen pro Frame."""
+        if self._pending_redraw is None and self._source:
+            self._pending_redraw = self.canvas.after(self.FRAME_MS, self._run_pending_redraw)
+
+    def _run_pending_redraw(self):
+        self._pending_redraw = None
+        self.redraw()
+
+    def show_message(self, text, **options):
+        self.clear()
+        options.setdefault("fill", "#999")
+        self._message_id = self.canvas.create_text(self.canvas.winfo_width() / 2, 40, text=text, **options)
+
+    def _hide_message(self):
+        if self._message_id is not None:
+            self.canvas.delete(self._message_id)
+            self._message_id = None
+
+    def clear(self):
+        self._hide_message()
+        self._source = None
+        self._values = []
+        self._geometry = None
+        self.canvas.itemconfigure("wavebar", state="hidden")
+
+
+# ====================================================================
+# --- KLASSE: TURNIERPLAN (INDIZIERT) ---
+# ====================================================================
+
+TOURNAMENT_COMBO_LIMIT = 200
+
+
+class TournamentMatch:
+    """Ein Spiel des Turnierplans (kompakt, ohne Attribut-Dict)."""
+
+    __slots__ = ("number", "team1", "team2", "time", "pitch", "group", "duration", "position")
+
+    def __init__(self, number, team1, team2, time="", pitch="", group="", duration=None):
+        self.number = number
+        self.team1 = team1
+        self.team2 = team2
+        self.time = time
+        self.pitch = pitch
+        self.group = group
+        self.duration = duration
+        self.position = -1
+
+    @property
+    def teams(self):
+        return self.team1, self.team2
+
+    def label(self):
+        parts = [self.number]
+        if self.time:
+            parts.append(self.time)
+        parts.append(f"{self.team1} – {self.team2}")
+        if self.pitch:
+            parts.append(f"Feld {self.pitch}")
+        return "  ".join(parts)
+
+
+class TournamentPlan:
+    """Spielplan mit Index nach Spielnummer und Nebenindizes nach Team, Feld und Gruppe.
+
+    Spielwechsel und "nächstes Spiel eines Teams" sind Dictionary-Zugriffe;
+    die Nebenindizes halten die Spiele in Planreihenfolge.
+    """
+
+    def __init__(self, matches=()):
+        self._matches = []
+        self._by_number = {}
+        # Combobox-Text -> Spiel; Spielnummern dürfen Leerzeichen enthalten ("Gr A 3")
+        self._by_label = {}
+        self._by_team = {}
+        self._by_pitch = {}
+        self._by_group = {}
+        # (team, nummer) -> Index in der Spielliste des Teams
+        self._team_slot = {}
+        self._team_positions = {}
+        for match in matches:
+            self.add(match)
+
+    def __len__(self):
+        return len(self._matches)
+
+    def __iter__(self):
+        return iter(self._matches)
+
+    def __bool__(self):
+        return bool(self._matches)
+
+    def add(self, match):
+        if match.number in self._by_number:
+            raise ValueError(f"Spielnummer {match.number} ist doppelt")
+        match.position = len(self._matches)
+        self._matches.append(match)
+        self._by_number[match.number] = match
+        self._by_label[match.label()] = match
+        for team in match.teams:
+            if not team:
+                continue
+            games = self._by_team.setdefault(team, [])
+            self._team_slot[(team, match.number)] = len(games)
+            games.append(match)
+            self._team_positions.setdefault(team, []).append(match.position)
+        if match.pitch:
+            self._by_pitch.setdefault(match.pitch, []).append(match)
+        if match.group:
+            self._by_group.setdefault(match.group, []).append(match)
+        return match
+
+    def get(self, number):
+        return self._by_number.get(number)
+
+    def match_for_label(self, text):
+        """Spiel zu einer Spielnummer oder einem Eintrag aus filter_labels()."""
+        text = text.strip()
+        match = self._by_number.get(text) or self._by_label.get(text)
+        if match is None and "  " in text:
+            match = self._by_number.get(text.split("  ", 1)[0])
+        return match
+
+    def first(self):
+        return self._matches[0] if self._matches else None
+
+    def after(self, match):
+        """Folgespiel im Plan oder None."""
+        position = match.position + 1
+        return self._matches[position] if position < len(self._matches) else None
+
+    def numbers(self):
+        return [match.number for match in self._matches]
+
+    def teams(self):
+        return sorted(self._by_team)
+
+    def pitches(self):
+        """Feldbezeichnungen wie im Plan, Nummern numerisch sortiert ("2" vor "10")."""
+        return sorted(self._by_pitch, key=lambda pitch: (not pitch.isdigit(), int(pitch) if pitch.isdigit() else 0, pitch))
+
+    def groups(self):
+        return sorted(self._by_group)
+
+    def matches_for_team(self, team):
+        return list(self._by_team.get(team, ()))
+
+    def matches_on_pitch(self, pitch):
+        return list(self._by_pitch.get(pitch, ()))
+
+    def matches_in_group(self, group):
+        return list(self._by_group.get(group, ()))
+
+    def next_for_team(self, team, after=None):
+        """Nächstes Spiel von ``team`` nach dem Spiel ``after`` (Nummer oder Spiel).
+
+        Ist ``after`` ein Spiel des Teams, ist das ein direkter Indexzugriff,
+        sonst eine binäre Suche über die Planpositionen des Teams.
+        """
+        games = self._by_team.get(team)
+        if not games:
+            return None
+        if after is None:
+            return games[0]
+        number = after.number if isinstance(after, TournamentMatch) else after
+        slot = self._team_slot.get((team, number))
+        if slot is not None:
+            return games[slot + 1] if slot + 1 < len(games) else None
+        reference = self._by_number.get(number)
+        if reference is None:
+            return None
+        index = bisect.bisect_right(self._team_positions[team], reference.position)
+        return games[index] if index < len(games) else None
+
+    def filter_labels(self, text, limit=TOURNAMENT_COMBO_LIMIT):
+        """Auswahlliste für die Combobox: Nummer, Team, Feld oder Gruppe passend zu ``text``."""
+        text = text.strip()
+        if not text:
+            candidates = self._matches
+        elif text in self._by_number:
+            # Spielnummern exakt wie im Plan (z.B. "A1"), erst danach ohne Groß/klein
+            candidates = [self._by_number[text]]
+        else:
+            text = text.lower()
+            candidates = (
+                match for match in self._matches
+                if match.number.lower().startswith(text)
+                or text in match.team1.lower()
+                or text in match.team2.lower()
+                or text == str(match.pitch).lower()
+                or text == str(match.group).lower()
+            )
+        return [match.label() for match in itertools.islice(candidates, limit)]
+
+
+# ====================================================================
+# --- KLASSE: TURNIERPLAN CSV-IMPORT (STREAMING) ---
+# ====================================================================
+
+class TournamentCsvImporter:
+    """Liest Spielpläne zeilenweise ein und sammelt Fehler je Zeile.
+
+    Kodierung (BOM, UTF-8, sonst Windows-1252) und Trennzeichen werden aus
+    dem Dateianfang erkannt, Spaltennamen über Aliasse zugeordnet. Fehlerhafte
+    Zeilen werden übersprungen und gemeldet, statt den Import abzubrechen.
+    """
+
+    COLUMN_ALIASES = {
+        "number": ("nr", "nr.", "spiel", "spielnr", "spiel-nr", "spielnummer", "nummer", "match"),
+        "team1": ("team1", "team 1", "heim", "mannschaft 1", "mannschaft1", "team a"),
+        "team2": ("team2", "team 2", "gast", "mannschaft 2", "mannschaft2", "team b"),
+        "time": ("zeit", "uhrzeit", "beginn", "anstoß", "anstoss", "time"),
+        "pitch": ("feld", "platz", "spielfeld", "pitch"),
+        "group": ("gruppe", "staffel", "altersklasse", "group"),
+        "duration": ("dauer", "spielzeit", "minuten", "duration"),
+    }
+    REQUIRED = ("number", "team1", "team2")
+    SAMPLE_BYTES = 64 * 1024
+    PROGRESS_ROWS = 500
+    _TIME_PATTERN = re.compile(r"^(\d{1,2})[:.](\d{2})$")
+
+    @classmethod
+    def detect_encoding(cls, sample, at_eof=None):
+        """``at_eof``: Probe enthält die ganze Datei (Standard: kürzer als SAMPLE_BYTES)."""
+        if at_eof is None:
+            at_eof = len(sample) < cls.SAMPLE_BYTES
+        if sample.startswith(b"\xef\xbb\xbf"):
+            return "utf-8-sig"
+        if sample.startswith((b"\xff\xfe", b"\xfe\xff")):
+            return "utf-16"
+        try:
+            sample.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            # Abgeschnittenes Mehrbyte-Zeichen am Ende der Probe zählt nicht,
+            # am Dateiende gibt es aber nichts abzuschneiden
+            if at_eof or exc.start < len(sample) - 3:
+                return "cp1252"
+        return "utf-8"
+
+    @staticmethod
+    def detect_delimiter(text):
+        try:
+            return csv.Sniffer().sniff(text, delimiters=";,\t|").delimiter
+        except csv.Error:
+            header = text.splitlines()[0] if text else ""
+            return max(";,\t|", key=header.count)
+
+    @classmethod
+    def map_columns(cls, header):
+        """Ordnet Feldnamen Spaltenindizes zu; fehlende Pflichtspalten sind ein ValueError."""
+        normalized = [cell.strip().lower() for cell in header]
+        columns = {}
+        for field, aliases in cls.COLUMN_ALIASES.items():
+            for index, name in enumerate(normalized):
+                if name in aliases:
+                    columns[field] = index
+                    break
+        missing = [field for field in cls.REQUIRED if field not in columns]
+        if missing:
+            raise ValueError("Pflichtspalten fehlen (Nr, Team1, Team2). Gefunden: " + ", ".join(header))
+        return columns
+
+    @classmethod
+    def _parse_row(cls, row, columns):
+        def cell(field):
+            index = columns.get(field)
+            return row[index].strip() if index is not None and index < len(row) else ""
+
+        number, team1, team2 = cell("number"), cell("team1"), cell("team2")
+        if not number:
+            raise ValueError("Spielnummer fehlt")
+        if not team1 or not team2:
+            raise ValueError("Team fehlt")
+        if team1 == team2:
+            raise ValueError(f"{team1} spielt gegen sich selbst")
+
+        match_time = cell("time")
+        if match_time:
+            parsed = cls._TIME_PATTERN.match(match_time)
+            if not parsed or int(parsed.group(1)) > 23 or int(parsed.group(2)) > 59:
+                raise ValueError(f"Ungültige Uhrzeit '{match_time}'")
+            match_time = f"{int(parsed.group(1)):02}:{parsed.group(2)}"
+
+        duration = cell("duration")
+        if duration:
+            digits = duration.split()[0]
+            if not digits.isdigit() or int(digits) <= 0:
+                raise ValueError(f"Ungültige Dauer '{duration}'")
+            duration = int(digits)
+        else:
+            duration = None
+
+        return TournamentMatch(number, team1, team2, match_time, cell("pitch"), cell("group"), duration)
+
+    @classmethod
+    def run(cls, path, on_progress=None, is_cancelled=None):
+        """Liefert ``(plan, errors)``; ``errors`` ist eine Liste ``(zeile, meldung)``.
+
+        ``on_progress(anteil)`` wird alle PROGRESS_ROWS Zeilen mit 0..1 aufgerufen.
+        """
+        size = max(1, os.path.getsize(path))
+        plan = TournamentPlan()
+        errors = []
+        with open(path, "rb") as raw:
+            sample = raw.read(cls.SAMPLE_BYTES)
+            encoding = cls.detect_encoding(sample, at_eof=not raw.read(1))
+            delimiter = cls.detect_delimiter(sample.decode(encoding, errors="ignore"))
+            raw.seek(0)
+            text = io.TextIOWrapper(raw, encoding=encoding, errors="replace", newline="")
+            reader = csv.reader(text, delimiter=delimiter)
+            header = next(reader, None)
+            if not header:
+                return plan, errors
+            columns = cls.map_columns(header)
+            for row in reader:
+                if not any(cell.strip() for cell in row):
+                    continue
+                try:
+                    plan.add(cls._parse_row(row, columns))
+                except ValueError as exc:
+                    errors.append((reader.line_num, str(exc)))
+                if reader.line_num % cls.PROGRESS_ROWS == 0:
+                    if is_cancelled is not None and is_cancelled():
+                        return None, errors
+                    if on_progress is not None:
+                        on_progress(min(1.0, raw.tell() / size))
+        return plan, errors
+
+
+# ====================================================================
+# --- KLASSE: SPIELPLAN-GENERATOR (JEDER GEGEN JEDEN / GRUPPEN) ---
+# ====================================================================
+
+class ScheduleGenerator:
+    """Erzeugt Spielpläne: Jeder gegen jeden, optional in Gruppen, auf mehreren Feldern.
+
+    Paarungen entstehen nach dem Kreisverfahren mit wechselnder Heim/Gast-
+    Ausrichtung (Differenz je Team höchstens 1). Die Verteilung auf Zeitfenster ist gierig: pro Fenster
+    werden die frühesten offenen Spiele gesetzt, deren Teams ihre
+    Mindestpause hinter sich haben.
+    """
+
+    _BREAK_PATTERN = re.compile(r"^\s*(\d{1,2})[:.](\d{2})\s*-\s*(\d{1,2})[:.](\d{2})\s*$")
+
+    @staticmethod
+    def parse_time(text):
+        """'HH:MM' in Minuten seit Mitternacht."""
+        parsed = TournamentCsvImporter._TIME_PATTERN.match(text.strip())
+        if not parsed or int(parsed.group(1)) > 23 or int(parsed.group(2)) > 59:
+            raise ValueError(f"Ungültige Uhrzeit '{text}'")
+        return int(parsed.group(1)) * 60 + int(parsed.group(2))
+
+    @classmethod
+    def parse_breaks(cls, text):
+        """'12:00-12:30, 15:00-15:15' in eine Liste ``(start, ende)`` in Minuten."""
+        breaks = []
+        for part in filter(None, (chunk.strip() for chunk in text.split(","))):
+            parsed = cls._BREAK_PATTERN.match(part)
+            if not parsed:
+                raise ValueError(f"Ungültige Pause '{part}' (Format 12:00-12:30)")
+            start = cls.parse_time(f"{parsed.group(1)}:{parsed.group(2)}")
+            end = cls.parse_time(f"{parsed.group(3)}:{parsed.group(4)}")
+            if end <= start:
+                raise ValueError(f"Pause '{part}' endet vor ihrem Beginn")
+            breaks.append((start, end))
+        return sorted(breaks)
+
+    @staticmethod
+    def split_groups(teams, count):
+        """Verteilt die Teams schlangenförmig auf ``count`` Gruppen (A, B, ...)."""
+        count = max(1, min(count, len(teams) // 2 or 1))
+        groups = [[] for _ in range(count)]
+        for index, team in enumerate(teams):
+            row, column = divmod(index, count)
+            groups[column if row % 2 == 0 else count - 1 - column].append(team)
+        return [(chr(ord("A") + index) if count > 1 else "", members) for index, members in enumerate(groups)]
+
+    @staticmethod
+    def round_robin(teams):
+        """Runden nach dem Kreisverfahren; bei ungerader Anzahl hat je ein Team spielfrei."""
+        players = list(teams)
+        if len(players) % 2:
+            # Spielfrei auf die feste Position: so bleibt Heim/Gast exakt ausgeglichen
+            players.insert(0, None)
+        count = len(players)
+        rounds = []
+        for round_index in range(count - 1):
+            pairs = []
+            for i in range(count // 2):
+                pair = (players[i], players[count - 1 - i])
+                # Feste Position wechselt je Runde, die übrigen je Tischposition
+                if (i == 0 and round_index % 2) or (i > 0 and i % 2):
+                    pair = pair[::-1]
+                pairs.append(pair)
+            rounds.append([pair for pair in pairs if None not in pair])
+            players.insert(1, players.pop())
+        return rounds
+
+    @classmethod
+    def generate(cls, teams, pitches=1, match_minutes=10, start="09:00", changeover_minutes=2,
+                 rest_minutes=0, breaks=(), groups=1):
+        teams = [team.strip() for team in teams if team.strip()]
+        if len(set(teams)) != len(teams):
+            raise ValueError("Teamnamen müssen eindeutig sein")
+        if len(teams) < 2:
+            raise ValueError("Mindestens zwei Teams nötig")
+        pitches = max(1, int(pitches))
+        slot_minutes = max(1, int(match_minutes) + max(0, int(changeover_minutes)))
+        rest_slots = math.ceil(max(0, int(rest_minutes)) / slot_minutes)
+
+        # Runden aller Gruppen verschränken, damit Gruppen parallel spielen
+        group_rounds = [(name, cls.round_robin(members)) for name, members in cls.split_groups(teams, groups)]
+        pending = deque()
+        for round_index in range(max(len(rounds) for _name, rounds in group_rounds)):
+            for name, rounds in group_rounds:
+                if round_index < len(rounds):
+                    pending.extend((name, pair) for pair in rounds[round_index])
+
+        free_from = dict.fromkeys(teams, 0)
+        lookahead = 4 * pitches + 16
+        plan = TournamentPlan()
+        minute = cls.parse_time(start)
+        slot = 0
+        while pending:
+            for break_start, break_end in breaks:
+                if minute < break_end and minute + slot_minutes > break_start:
+                    minute = break_end
+            busy = set()
+            placed = 0
+            index = 0
+            while placed < pitches and index < min(lookahead, len(pending)):
+                group, (team_a, team_b) = pending[index]
+                if team_a in busy or team_b in busy or free_from[team_a] > slot or free_from[team_b] > slot:
+                    index += 1
+                    continue
+                del pending[index]
+                busy.update((team_a, team_b))
+                free_from[team_a] = free_from[team_b] = slot + 1 + rest_slots
+                placed += 1
+                plan.add(TournamentMatch(
+                    str(len(plan) + 1), team_a, team_b,
+                    f"{minute // 60 % 24:02}:{minute % 60:02}",
+                    str(placed) if pitches > 1 else "",
+                    group,
+                    int(match_minutes),
+                ))
+            slot += 1
+            minute += slot_minutes
+        return plan
+
+
+# ====================================================================
+# --- KLASSE: TABELLE (INKREMENTELL) ---
+# ====================================================================
+
+class _TeamRecord:
+    __slots__ = ("team", "group", "played", "won", "drawn", "lost", "goals_for", "goals_against")
+
+    def __init__(self, team, group):
+        self.team = team
+        self.group = group
+        self.played = self.won = self.drawn = self.lost = 0
+        self.goals_for = self.goals_against = 0
+
+    @property
+    def points(self):
+        return self.won * 3 + self.drawn
+
+    @property
+    def goal_difference(self):
+        return self.goals_for - self.goals_against
+
+    def sort_key(self):
+        return (-self.points, -self.goal_difference, -self.goals_for, self.team)
+
+
+class StandingsTable:
+    """Tabelle je Gruppe, die mit jedem gemeldeten Ergebnis fortgeschrieben wird.
+
+    Jedes Ergebnis ändert nur die Zähler der beiden beteiligten Teams und
+    verschiebt deren Sortierschlüssel per ``bisect`` in der Gruppenliste.
+    Direkte Vergleiche werden je Paarung mitgeführt und nur für Teams
+    ausgewertet, die nach Punkten, Tordifferenz und Toren gleichauf liegen.
+    Ein erneut gemeldetes Spiel ersetzt sein altes Ergebnis.
+    """
+
+    def __init__(self):
+        self._records = {}
+        self._ordered = {}
+        self._results = {}
+        # (team, gegner) -> [Punkte, Tore, Gegentore] aus den direkten Duellen
+        self._head_to_head = {}
+
+    def __len__(self):
+        return len(self._results)
+
+    def add_team(self, team, group=""):
+        if team in self._records:
+            return
+        record = _TeamRecord(team, group)
+        self._records[team] = record
+        bisect.insort(self._ordered.setdefault(group, []), record.sort_key())
+
+    def groups(self):
+        return sorted(self._ordered)
+
+    def result(self, number):
+        return self._results.get(number)
+
+    def record(self, number, team1, team2, goals1, goals2, group=""):
+        """Trägt ein Ergebnis ein oder korrigiert ein bereits gemeldetes."""
+        self.remove(number)
+        self.add_team(team1, group)
+        self.add_team(team2, group)
+        self._results[number] = (team1, team2, goals1, goals2)
+        self._apply(team1, team2, goals1, goals2, 1)
+
+    def remove(self, number):
+        previous = self._results.pop(number, None)
+        if previous:
+            self._apply(*previous, -1)
+
+    def _apply(self, team1, team2, goals1, goals2, sign):
+        for team, opponent, scored, conceded in ((team1, team2, goals1, goals2), (team2, team1, goals2, goals1)):
+            record = self._records[team]
+            ordered = self._ordered[record.group]
+            del ordered[bisect.bisect_left(ordered, record.sort_key())]
+
+            record.played += sign
+            record.goals_for += sign * scored
+            record.goals_against += sign * conceded
+            if scored > conceded:
+                record.won += sign
+                points = 3
+            elif scored == conceded:
+                record.drawn += sign
+                points = 1
+            else:
+                record.lost += sign
+                points = 0
+            bisect.insort(ordered, record.sort_key())
+
+            duel = self._head_to_head.setdefault((team, opponent), [0, 0, 0])
+            duel[0] += sign * points
+            duel[1] += sign * scored
+            duel[2] += sign * conceded
+
+    def _duel_key(self, team, rivals):
+        points = goals_for = goals_against = 0
+        for rival in rivals:
+            duel = self._head_to_head.get((team, rival))
+            if duel:
+                points += duel[0]
+                goals_for += duel[1]
+                goals_against += duel[2]
+        return (-points, goals_against - goals_for, -goals_for)
+
+    def rows(self, group=""):
+        """Sortierte Tabellenzeilen ``(Platz, _TeamRecord)`` einer Gruppe."""
+        keys = self._ordered.get(group, [])
+        rows = []
+        for _tie, block in itertools.groupby(keys, key=operator.itemgetter(0, 1, 2)):
+            teams = [key[3] for key in block]
+            if len(teams) == 1:
+                rows.append((len(rows) + 1, self._records[teams[0]]))
+                continue
+            duel_keys = {team: self._duel_key(team, teams) for team in teams}
+            teams.sort(key=lambda team: (duel_keys[team], team))
+            block_start = len(rows)
+            for index, team in enumerate(teams):
+                # Auch im direkten Vergleich gleichauf -> gleicher Platz
+                if index and duel_keys[team] == duel_keys[teams[index - 1]]:
+                    rank = rows[-1][0]
+                else:
+                    rank = block_start + index + 1
+                rows.append((rank, self._records[team]))
+        return rows
+
+
+# ====================================================================
+# --- KLASSE: MEHRFELD-BETRIEB (GEMEINSAMER TAKT) ---
+# ====================================================================
+
+# Fälligkeiten, die so dicht beieinander liegen, laufen in einem Callback
+PITCH_COALESCE_SECONDS = 0.015
+# Gemeinsames Anzeigeraster aller Felder
+PITCH_GRID_SECONDS = 1.0
+# Heap-Schlüssel des Rastertakts (Felder zählen ab 1)
+_GRID_TICK = 0
+
+
+class PitchState:
+    """Spielzustand eines Feldes im Mehrfeld-Betrieb."""
+
+    def __init__(self, number, scoreboard, clock=time.monotonic):
+        self.number = number
+        self.scoreboard = scoreboard
+        self.clock = MatchClock(clock)
+        self.duration_seconds = 10 * 60
+        self.teams = ("Heim", "Gast")
+        self.scores = [0, 0]
+        self.match = None
+        self.ended = False
+        # Feldbezeichnung im Turnierplan (z.B. "2" oder "Platz A")
+        self.plan_key = str(number)
+        # Jeder Start/Stopp erhöht die Generation; alte Heap-Einträge verfallen
+        self.generation = 0
+
+    @property
+    def running(self):
+        return self.clock.running
+
+    @property
+    def label(self):
+        return f"Feld {self.plan_key}" if self.plan_key.isdigit() else self.plan_key
+
+    def time_text(self, seconds=None):
+        seconds = self.clock.whole_seconds() if seconds is None else seconds
+        return f"{seconds // 60:02}:{seconds % 60:02}"
+
+
+class MultiPitchController:
+    """Treibt mehrere Spielfelder über einen Heap und einen einzigen ``root.after``.
+
+    Alle Anzeigen laufen auf einem gemeinsamen Sekundenraster: ein Takt im
+    Heap aktualisiert sämtliche laufenden Felder, die Zahl der Callbacks
+    hängt also nicht von der Zahl der Felder ab. Dafür zeigt ein Feld seine
+    neue Sekunde bis zu einem Rasterschritt später an. Exakt geplant sind
+    nur die Spielenden (je Feld ein Heap-Eintrag); die Hupe läuft über einen
+    einzigen BuzzerScheduler, der immer auf das nächste Spielende gestellt ist.
+    """
+
+    def __init__(self, root, buzzer_source, on_render=None, on_match_end=None, clock=time.monotonic):
+        self.root = root
+        self.buzzer_source = buzzer_source
+        self.on_render = on_render
+        self.on_match_end = on_match_end
+        self._clock = clock
+        self.pitches = []
+        self._heap = []
+        self._sequence = itertools.count()
+        self._after_id = None
+        self._after_due = None
+        self._grid_origin = None
+        self._grid_scheduled = False
+        self.buzzer = BuzzerScheduler(clock)
+        self._buzzer_pitch = None
+        self.callbacks = 0
+
+    def add_pitch(self, scoreboard):
+        pitch = PitchState(len(self.pitches) + 1, scoreboard, self._clock)
+        self.pitches.append(pitch)
+        self._render(pitch, "BEREIT")
+        return pitch
+
+    def shutdown(self):
+        for pitch in self.pitches:
+            pitch.clock.pause()
+            pitch.generation += 1
+        self.buzzer.cancel()
+        self._heap.clear()
+        self._grid_scheduled = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    # --- Steuerung je Feld ---
 
-        lines.append(current)
-        return lines[:3]
+    def set_match(self, pitch, team1, team2, duration_seconds, match=None):
+        self.reset(pitch)
+        pitch.teams = (team1, team2)
+        pitch.duration_seconds = duration_seconds
+        pitch.match = match
+        pitch.scoreboard.set_team_names(team1, team2)
+        self._render(pitch, "BEREIT")
 
-    def _update_wrapped_team_names(self):
-        wrap_len = int(self.lbl_home_team.cget("wraplength")) or 240
-        home_lines = self._format_team_name_lines(self.team_home_name_raw, wrap_len)
-        away_lines = self._format_team_name_lines(self.team_away_name_raw, wrap_len)
+    def start(self, pitch):
+        if pitch.running or pitch.ended:
+            return
+        pitch.clock.start()
+        pitch.generation += 1
+        heapq.heappush(
+            self._heap,
+            (pitch.clock.deadline_for(pitch.duration_seconds), next(self._sequence), pitch.number, pitch.generation),
+        )
+        self._schedule_grid()
+        self.sync_buzzer()
+        self._render(pitch, "LÄUFT")
 
-        line_count = max(len(home_lines), len(away_lines), self.lbl_home_team.cget("height"))
-        while len(home_lines) < line_count:
-            home_lines.append("")
-        while len(away_lines) < line_count:
-            away_lines.append("")
+    def stop(self, pitch):
+        if not pitch.running:
+            return
+        pitch.clock.pause()
+        pitch.generation += 1
+        self.sync_buzzer()
+        self._render(pitch, "PAUSE")
+
+    def reset(self, pitch):
+        pitch.clock.pause()
+        pitch.clock.set_elapsed(0)
+        pitch.generation += 1
+        pitch.scores = [0, 0]
+        pitch.ended = False
+        self.sync_buzzer()
+        self._render(pitch, "BEREIT")
+
+    def add_goal(self, pitch, side, delta):
+        pitch.scores[side] = max(0, pitch.scores[side] + delta)
+        self._render(pitch, "SPIEL ENDE" if pitch.ended else ("LÄUFT" if pitch.running else "PAUSE"))
+        if pitch.ended and self.on_match_end:
+            self.on_match_end(pitch)
+
+    # --- Gemeinsamer Takt ---
+
+    def _schedule_grid(self):
+        if self._grid_scheduled:
+            self._rearm()
+            return
+        now = self._clock()
+        if self._grid_origin is None:
+            self._grid_origin = now
+        steps = math.floor((now - self._grid_origin) / PITCH_GRID_SECONDS) + 1
+        heapq.heappush(self._heap, (self._grid_origin + steps * PITCH_GRID_SECONDS, next(self._sequence), _GRID_TICK, 0))
+        self._grid_scheduled = True
+        self._rearm()
+
+    def _is_stale(self, entry):
+        number, generation = entry[2], entry[3]
+        return number != _GRID_TICK and generation != self.pitches[number - 1].generation
+
+    def _rearm(self):
+        # Veraltete Einträge oben im Heap gleich verwerfen
+        while self._heap and self._is_stale(self._heap[0]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return
+        due = self._heap[0][0]
+        if self._after_id is not None:
+            if self._after_due <= due:
+                return
+            self.root.after_cancel(self._after_id)
+        delay_ms = max(1, int(math.ceil((due - self._clock()) * 1000)) + 1)
+        self._after_due = due
+        self._after_id = self.root.after(delay_ms, self._run_due)
 
-        self.team_home_name.set("\n".join(home_lines))
-        self.team_away_name.set("\n".join(away_lines))
+    def _run_due(self):
+        self._after_id = None
+        self._after_due = None
+        self.callbacks += 1
+        now = self._clock()
+        grid_tick = False
+        while self._heap and self._heap[0][0] <= now + PITCH_COALESCE_SECONDS:
+            entry = heapq.heappop(self._heap)
+            if entry[2] == _GRID_TICK:
+                grid_tick = True
+            elif not self._is_stale(entry) and entry[0] <= now:
+                self._finish(self.pitches[entry[2] - 1])
+            elif not self._is_stale(entry):
+                # Spielende nur knapp voraus: exakt nachfassen statt früh beenden
+                heapq.heappush(self._heap, entry)
+                break
+
+        if grid_tick:
+            self._grid_scheduled = False
+            running = [pitch for pitch in self.pitches if pitch.running]
+            for pitch in running:
+                self._render(pitch, "LÄUFT")
+            if running:
+                self._schedule_grid()
+        self._rearm()
+
+    def _finish(self, pitch):
+        pitch.clock.pause()
+        pitch.clock.set_elapsed(pitch.duration_seconds)
+        pitch.generation += 1
+        pitch.ended = True
+        self._render(pitch, "SPIEL ENDE")
+        # Die Anzeige kann der Hupe um Millisekunden vorauslaufen; eine für
+        # dieses Feld gestellte Hupe stellt sich nach dem Auslösen selbst weiter
+        if not (self.buzzer.armed and self._buzzer_pitch == pitch.number):
+            self.sync_buzzer()
+        if self.on_match_end:
+            self.on_match_end(pitch)
+
+    def _render(self, pitch, status, seconds=None):
+        time_text = pitch.time_text(seconds)
+        last_minute = pitch.clock.elapsed() >= pitch.duration_seconds - 60
+        color = ACCENT_RED if last_minute and (pitch.running or pitch.ended) else pitch.scoreboard.bg_color
+        pitch.scoreboard.update(time_text, status, pitch.scores[0], pitch.scores[1], color)
+        if self.on_render:
+            self.on_render(pitch, time_text, color, status)
+
+    # --- Hupe ---
+
+    def sync_buzzer(self):
+        """Stellt die eine Hupe auf das nächste Spielende aller laufenden Felder."""
+        upcoming = [
+            (pitch.clock.deadline_for(pitch.duration_seconds), pitch.number)
+            for pitch in self.pitches
+            if pitch.running
+        ]
+        upcoming = [entry for entry in upcoming if entry[0] > self._clock()]
+        source = self.buzzer_source() if upcoming else None
+        if not source:
+            self.buzzer.cancel()
+            self._buzzer_pitch = None
+            return
+        deadline, number = min(upcoming)
+        if self.buzzer.armed and self._buzzer_pitch == number and abs(self.buzzer.deadline - deadline) < 0.001:
+            return
+        channel, sound = source
+        self._buzzer_pitch = number
+        self.buzzer.arm(deadline, channel, sound, on_fire=lambda *_args: self.root.after(0, self.sync_buzzer))
 
 
 # ====================================================================
@@ -305,7 +3260,10 @@ class FussballTimer:
         self.settings_path = get_settings_path()
         self.settings_path_var = tk.StringVar(value=str(self.settings_path))
         self.match_mode = tk.StringVar(value="normal")
-        self.tournament_matches = []
+        self.tournament_plan = TournamentPlan()
+        self.current_match = None
+        self.standings = StandingsTable()
+        self._csv_import_token = 0
         self.match_number_var = tk.StringVar(value="")
         self.total_halves = 2
         self.current_half = 1
@@ -315,6 +3273,18 @@ class FussballTimer:
         self.auto_jingle_user_choice = None
         self.hall_buzzer_enabled = tk.BooleanVar(value=False)
         self.hall_buzzer_file = ""
+        self.hall_buzzer_preset = DEFAULT_BUZZER_PRESET
+        self.buzzer_synth = BuzzerSynth()
+        self.jingle_pool_budget_mb = tk.IntVar(value=64)
+        self.jingle_normalize_enabled = tk.BooleanVar(value=True)
+        self.jingle_start_mode = tk.StringVar(value="ton")
+        self.jingle_library_folders = []
+        self.jingle_categories = []
+        self._saved_jingle_paths = []
+        self.audio_frequency = tk.IntVar(value=22050)
+        self.audio_buffer = tk.IntVar(value=512)
+        self.audio_channels = tk.IntVar(value=2)
+        self.audio_buzzer_channel = tk.IntVar(value=2)
         self.csv_status_var = tk.StringVar(value="Kein CSV geladen")
 
         # Team- und Spielzeit-Defaults müssen vor dem Laden der Einstellungen existieren
@@ -328,6 +3298,8 @@ class FussballTimer:
         self.seconds = 0
         self.running = False
         self._after_id = None
+        self.clock = MatchClock()
+        self._latency_probe_running = False
 
         self.default_settings = {
             "controller_title": self.controller_title.get(),
@@ -349,6 +3321,17 @@ class FussballTimer:
             "auto_jingle_enabled": self.auto_jingle_enabled.get(),
             "hall_buzzer_enabled": self.hall_buzzer_enabled.get(),
             "hall_buzzer_file": self.hall_buzzer_file,
+            "hall_buzzer_preset": self.hall_buzzer_preset,
+            "jingle_pool_budget_mb": self.jingle_pool_budget_mb.get(),
+            "jingle_normalize_enabled": self.jingle_normalize_enabled.get(),
+            "jingle_start_mode": self.jingle_start_mode.get(),
+            "audio_frequency": self.audio_frequency.get(),
+            "audio_buffer": self.audio_buffer.get(),
+            "audio_channels": self.audio_channels.get(),
+            "audio_buzzer_channel": self.audio_buzzer_channel.get(),
+            "jingle_library_folders": [],
+            "jingle_categories": [],
+            "jingle_paths": [],
         }
 
         self._load_settings()
@@ -361,6 +3344,9 @@ class FussballTimer:
 
         self.jingle_paths = []
         self.jingle_triggered = False
+        self._prefetch_path = None
+        self._prefetch_token = 0
+        self._loudness_scan_token = 0
         
         self.scoreboard = ScoreboardDisplay(
             root,
@@ -374,20 +3360,53 @@ class FussballTimer:
         self.scoreboard_enabled.trace_add("write", self._toggle_scoreboard)
         
         # Audio
-        try:
-            # Behebungsvorschlag aus der vorherigen Konversation: Frequenz auf 22050 gesetzt, falls 44100 nicht geht.
-            pygame.mixer.init(frequency=22050)
-        except Exception:
+        self.audio_engine = AudioEngine(
+            self.audio_frequency.get(),
+            self.audio_buffer.get(),
+            self.audio_channels.get(),
+            self.audio_buzzer_channel.get(),
+        )
+        if not self.audio_engine.start():
             messagebox.showerror("Fehler", "Pygame Mixer konnte nicht initialisiert werden. Audiofunktionen sind deaktiviert.")
+
+        self.resample_cache = ResampleCache(get_settings_path().parent / "audio_cache")
+        self.jingle_pool = JinglePool(self.jingle_pool_budget_mb.get() * 1024 * 1024, transcoder=self.resample_cache)
+        self.channel_mixer = ChannelMixer()
+        self.buzzer_scheduler = BuzzerScheduler()
+        self.buzzer_log_path = get_settings_path().with_name("buzzer_log.csv")
+        if pygame.mixer.get_init():
+            self.audio_engine.reserve_channels()
+            self.channel_mixer.attach()
             
         self.jingle_playing = False
         self.jingle_start_time = None
+        self._jingle_channel = None
+        self._update_loop_id = None
+        self._progress_value = 0
         self.wave_reduced = None
         self.wave_duration = 0
+        self.wave_offset = 0.0
+        self._wave_full = (None, 0)
         self.max_amp_scale = 1.0
+        self.jingle_offset = 0.0
+        self._playing_path = None
         self.current_jingle_path = None
         self._buzzer_sound = None
         self._buzzer_sound_source = None
+        self.peak_cache = PeakCache(get_settings_path().with_name("peak_cache"))
+        try:
+            # Frühere Ein-Datei-Variante des Caches
+            get_settings_path().with_name("peak_cache.json").unlink()
+        except OSError:
+            pass
+        self.analysis_service = AnalysisService(self.root, self._analyze_and_cache)
+        self.jingle_library = JingleLibrary(
+            self.root,
+            get_settings_path().with_name("jingle_library.sqlite3"),
+            self._library_analysis,
+        )
+        self._library_rescan_id = None
+        self._prepare_buzzer_cache()
 
         self.create_widgets()
 
@@ -403,6 +3422,10 @@ class FussballTimer:
         self.wave_canvas.bind("<Configure>", self._on_resize)
         self.root.bind("<space>", lambda e: self.toggle_timer())
 
+        self._restore_jingle_selection()
+        if self.jingle_library_folders:
+            self._rescan_library()
+
     # --- UI HELPER METHODEN (Unverändert) ---
     def _big_btn(self, parent, text, cmd, color):
         return tk.Button(parent, text=text, font=("Arial", 12, "bold"), bg=color, fg="white",
@@ -548,6 +3571,26 @@ class FussballTimer:
         if "hall_buzzer_enabled" in data:
             self.hall_buzzer_enabled.set(bool(data.get("hall_buzzer_enabled", self.hall_buzzer_enabled.get())))
         self.hall_buzzer_file = data.get("hall_buzzer_file", self.hall_buzzer_file)
+        if data.get("hall_buzzer_preset") in BUZZER_PRESETS:
+            self.hall_buzzer_preset = data["hall_buzzer_preset"]
+        self.jingle_pool_budget_mb.set(max(0, int(data.get("jingle_pool_budget_mb", self.jingle_pool_budget_mb.get()))))
+        if hasattr(self, "jingle_pool"):
+            self.jingle_pool.budget_bytes = self.jingle_pool_budget_mb.get() * 1024 * 1024
+        if "jingle_normalize_enabled" in data:
+            self.jingle_normalize_enabled.set(bool(data["jingle_normalize_enabled"]))
+        if data.get("jingle_start_mode") in JINGLE_START_MODES:
+            self.jingle_start_mode.set(data["jingle_start_mode"])
+        self.jingle_library_folders = list(data.get("jingle_library_folders", self.jingle_library_folders))
+        self.jingle_categories = list(data.get("jingle_categories", self.jingle_categories))
+        self._saved_jingle_paths = list(data.get("jingle_paths", self._saved_jingle_paths))
+        if hasattr(self, "file_label"):
+            self._restore_jingle_selection()
+        self.audio_frequency.set(int(data.get("audio_frequency", self.audio_frequency.get())))
+        self.audio_buffer.set(int(data.get("audio_buffer", self.audio_buffer.get())))
+        self.audio_channels.set(int(data.get("audio_channels", self.audio_channels.get())))
+        self.audio_buzzer_channel.set(max(len(JINGLE_CHANNELS), int(data.get("audio_buzzer_channel", self.audio_buzzer_channel.get()))))
+        if hasattr(self, "audio_engine"):
+            self._apply_audio_engine_settings()
         self._buzzer_sound = None
         self._buzzer_sound_source = None
         self._set_mode(data.get("match_mode", self.match_mode.get()))
@@ -573,6 +3616,17 @@ class FussballTimer:
             "auto_jingle_enabled": self.auto_jingle_enabled.get(),
             "hall_buzzer_enabled": self.hall_buzzer_enabled.get(),
             "hall_buzzer_file": self.hall_buzzer_file,
+            "hall_buzzer_preset": self.hall_buzzer_preset,
+            "jingle_pool_budget_mb": self.jingle_pool_budget_mb.get(),
+            "jingle_normalize_enabled": self.jingle_normalize_enabled.get(),
+            "jingle_start_mode": self.jingle_start_mode.get(),
+            "audio_frequency": self.audio_frequency.get(),
+            "audio_buffer": self.audio_buffer.get(),
+            "audio_channels": self.audio_channels.get(),
+            "audio_buzzer_channel": self.audio_buzzer_channel.get(),
+            "jingle_library_folders": self.jingle_library_folders,
+            "jingle_categories": self.jingle_categories,
+            "jingle_paths": getattr(self, "jingle_paths", self._saved_jingle_paths),
         }
 
         try:
@@ -612,6 +3666,18 @@ class FussballTimer:
         self.auto_jingle_user_choice = self.auto_jingle_enabled.get()
         self.hall_buzzer_enabled.set(defaults.get("hall_buzzer_enabled", False))
         self.hall_buzzer_file = defaults.get("hall_buzzer_file", "")
+        self.hall_buzzer_preset = defaults.get("hall_buzzer_preset", DEFAULT_BUZZER_PRESET)
+        self.jingle_pool_budget_mb.set(defaults.get("jingle_pool_budget_mb", 64))
+        self.jingle_pool.budget_bytes = self.jingle_pool_budget_mb.get() * 1024 * 1024
+        self.jingle_normalize_enabled.set(defaults.get("jingle_normalize_enabled", True))
+        self.jingle_start_mode.set(defaults.get("jingle_start_mode", "ton"))
+        self.jingle_library_folders = list(defaults.get("jingle_library_folders", []))
+        self.jingle_categories = list(defaults.get("jingle_categories", []))
+        self.audio_frequency.set(defaults.get("audio_frequency", 22050))
+        self.audio_buffer.set(defaults.get("audio_buffer", 512))
+        self.audio_channels.set(defaults.get("audio_channels", 2))
+        self.audio_buzzer_channel.set(defaults.get("audio_buzzer_channel", 2))
+        self._apply_audio_engine_settings()
         self._buzzer_sound = None
         self._buzzer_sound_source = None
         self._set_mode(self.match_mode.get())
@@ -646,6 +3712,19 @@ class FussballTimer:
             self.hall_buzzer_enabled_var.set(self.hall_buzzer_enabled.get())
         if hasattr(self, "hall_buzzer_file_var"):
             self.hall_buzzer_file_var.set(self.hall_buzzer_file)
+        if hasattr(self, "hall_buzzer_preset_var"):
+            self.hall_buzzer_preset_var.set(self.hall_buzzer_preset)
+        if hasattr(self, "jingle_pool_budget_var"):
+            self.jingle_pool_budget_var.set(self.jingle_pool_budget_mb.get())
+        if hasattr(self, "jingle_normalize_var"):
+            self.jingle_normalize_var.set(self.jingle_normalize_enabled.get())
+        if hasattr(self, "jingle_start_mode_var"):
+            self.jingle_start_mode_var.set(self.jingle_start_mode.get())
+        if hasattr(self, "audio_frequency_var"):
+            self.audio_frequency_var.set(self.audio_frequency.get())
+            self.audio_buffer_var.set(self.audio_buffer.get())
+            self.audio_channels_var.set(self.audio_channels.get())
+            self.audio_buzzer_channel_var.set(self.audio_buzzer_channel.get())
 
     def _refresh_settings_form(self):
         if not hasattr(self, "settings_window") or not self.settings_window.winfo_exists():
@@ -670,6 +3749,14 @@ class FussballTimer:
         self.scoreboard_text_color_var.set(self.scoreboard_text_color)
         self.hall_buzzer_enabled_var.set(self.hall_buzzer_enabled.get())
         self.hall_buzzer_file_var.set(self.hall_buzzer_file)
+        self.hall_buzzer_preset_var.set(self.hall_buzzer_preset)
+        self.jingle_pool_budget_var.set(self.jingle_pool_budget_mb.get())
+        self.jingle_normalize_var.set(self.jingle_normalize_enabled.get())
+        self.jingle_start_mode_var.set(self.jingle_start_mode.get())
+        self.audio_frequency_var.set(self.audio_frequency.get())
+        self.audio_buffer_var.set(self.audio_buffer.get())
+        self.audio_channels_var.set(self.audio_channels.get())
+        self.audio_buzzer_channel_var.set(self.audio_buzzer_channel.get())
         self.settings_path_var.set(str(self.settings_path))
 
     def _prompt_load_settings_file(self):
@@ -803,6 +3890,7 @@ class FussballTimer:
         self.current_half += 1
         duration = self._get_desired_match_seconds()
         self.seconds = duration * (self.current_half - 1)
+        self.clock.set_elapsed(self.seconds)
         self.jingle_triggered = False
         self.current_match_duration_seconds = duration * self.current_half if self.match_mode.get() == "normal" else duration
         minutes = self.seconds // 60
@@ -834,6 +3922,15 @@ class FussballTimer:
         self.match_mode_var = tk.StringVar(value=self.match_mode.get())
         self.hall_buzzer_enabled_var = tk.BooleanVar(value=self.hall_buzzer_enabled.get())
         self.hall_buzzer_file_var = tk.StringVar(value=self.hall_buzzer_file)
+        self.hall_buzzer_preset_var = tk.StringVar(value=self.hall_buzzer_preset)
+        self.jingle_pool_budget_var = tk.IntVar(value=self.jingle_pool_budget_mb.get())
+        self.jingle_normalize_var = tk.BooleanVar(value=self.jingle_normalize_enabled.get())
+        self.jingle_start_mode_var = tk.StringVar(value=self.jingle_start_mode.get())
+        self.audio_frequency_var = tk.IntVar(value=self.audio_frequency.get())
+        self.audio_buffer_var = tk.IntVar(value=self.audio_buffer.get())
+        self.audio_channels_var = tk.IntVar(value=self.audio_channels.get())
+        self.audio_buzzer_channel_var = tk.IntVar(value=self.audio_buzzer_channel.get())
+        self.audio_probe_var = tk.StringVar(value=self._format_latency_probe(self.audio_engine.last_probe))
 
         self.controller_bg_color_var = tk.StringVar(value=self.controller_bg_color)
         self.controller_header_color_var = tk.StringVar(value=self.controller_header_color)
@@ -999,13 +4096,89 @@ class FussballTimer:
             fg=self.controller_text_color,
         ).pack(side="left", padx=(0, 4))
 
+        buzzer_preset_row = tk.Frame(mode_section, bg=self.controller_bg_color)
+        buzzer_preset_row.pack(fill="x", pady=(4, 0))
+        tk.Label(
+            buzzer_preset_row,
+            text="Hupe Klang (ohne Datei)",
+            bg=self.controller_bg_color,
+            fg=self.controller_text_color,
+        ).pack(side="left", padx=5)
+        ttk.Combobox(
+            buzzer_preset_row,
+            textvariable=self.hall_buzzer_preset_var,
+            values=list(BUZZER_PRESETS),
+            state="readonly",
+            width=10,
+        ).pack(side="left", padx=5)
+
         csv_row = tk.Frame(scoreboard_section, bg=self.controller_bg_color)
         csv_row.pack(fill="x", padx=5, pady=(2, 0))
         tk.Label(csv_row, text="CSV Import (Turnier)", bg=self.controller_bg_color, fg=self.controller_text_color).pack(side="left")
         self.csv_load_btn = tk.Button(csv_row, text="Datei wählen", command=self.load_tournament_csv, bg=ACCENT_GREEN, fg=RSK_WHITE)
         self.csv_load_btn.pack(side="left", padx=6)
+        tk.Button(csv_row, text="Spielplan erstellen", command=self._open_schedule_generator, bg=self.controller_card_bg, fg=self.controller_text_color)\
+            .pack(side="left", padx=(0, 6))
         tk.Label(csv_row, textvariable=self.csv_status_var, bg=self.controller_bg_color, fg="#666").pack(side="left")
 
+        audio_section = tk.LabelFrame(content, text="Audio", bg=self.controller_bg_color, fg=self.controller_text_color)
+        audio_section.pack(fill="x", pady=5)
+
+        pool_row = tk.Frame(audio_section, bg=self.controller_bg_color)
+        pool_row.pack(fill="x", pady=5)
+        tk.Label(pool_row, text="Jingle-Speicher (MB, vorgeladen)", bg=self.controller_bg_color, fg=self.controller_text_color).pack(side="left", padx=5)
+        tk.Entry(pool_row, width=6, textvariable=self.jingle_pool_budget_var).pack(side="left")
+        tk.Checkbutton(
+            pool_row,
+            text="Jingles auf gleiche Lautheit bringen",
+            variable=self.jingle_normalize_var,
+            bg=self.controller_bg_color,
+            fg=self.controller_text_color,
+            relief="flat",
+            cursor="hand2",
+        ).pack(side="left", padx=(12, 0))
+
+        start_row = tk.Frame(audio_section, bg=self.controller_bg_color)
+        start_row.pack(fill="x", pady=(0, 5))
+        tk.Label(start_row, text="Jingle-Start", bg=self.controller_bg_color, fg=self.controller_text_color).pack(side="left", padx=5)
+        ttk.Combobox(
+            start_row,
+            textvariable=self.jingle_start_mode_var,
+            values=list(JINGLE_START_MODES),
+            state="readonly",
+            width=10,
+        ).pack(side="left", padx=5)
+        tk.Label(
+            start_row,
+            text="anfang = Dateianfang, ton = ohne Stille, lautester = lautester Abschnitt",
+            bg=self.controller_bg_color,
+            fg="#666",
+        ).pack(side="left")
+
+        engine_row = tk.Frame(audio_section, bg=self.controller_bg_color)
+        engine_row.pack(fill="x", pady=(0, 5))
+        tk.Label(engine_row, text="Samplerate", bg=self.controller_bg_color, fg=self.controller_text_color).pack(side="left", padx=5)
+        ttk.Combobox(engine_row, textvariable=self.audio_frequency_var, values=AUDIO_SAMPLE_RATES, width=7).pack(side="left")
+        tk.Label(engine_row, text="Puffer", bg=self.controller_bg_color, fg=self.controller_text_color).pack(side="left", padx=5)
+        ttk.Combobox(engine_row, textvariable=self.audio_buffer_var, values=AUDIO_BUFFER_SIZES, width=6).pack(side="left")
+        tk.Label(engine_row, text="Kanäle", bg=self.controller_bg_color, fg=self.controller_text_color).pack(side="left", padx=5)
+        ttk.Combobox(engine_row, textvariable=self.audio_channels_var, values=(1, 2), state="readonly", width=3).pack(side="left")
+        tk.Label(engine_row, text="Hupen-Kanal", bg=self.controller_bg_color, fg=self.controller_text_color).pack(side="left", padx=5)
+        tk.Spinbox(engine_row, from_=len(JINGLE_CHANNELS), to=15, width=3, textvariable=self.audio_buzzer_channel_var).pack(side="left")
+
+        probe_row = tk.Frame(audio_section, bg=self.controller_bg_color)
+        probe_row.pack(fill="x", pady=(0, 5))
+        self.audio_probe_btn = tk.Button(
+            probe_row,
+            text="Latenz messen",
+            command=self._run_latency_probe,
+            bg=self.controller_card_bg,
+            fg=self.controller_text_color,
+            state="disabled" if self.running or self._latency_probe_running else "normal",
+        )
+        self.audio_probe_btn.pack(side="left", padx=5)
+        tk.Label(probe_row, textvariable=self.audio_probe_var, bg=self.controller_bg_color, fg="#666").pack(side="left")
+
         section_colors = tk.LabelFrame(content, text="Farben (kompakt)", bg=self.controller_bg_color, fg=self.controller_text_color)
         section_colors.pack(fill="x", pady=5, padx=5)
 
@@ -1152,7 +4325,7 @@ class FussballTimer:
             desired_minutes = self.match_duration_minutes.get()
         self.match_duration_minutes.set(desired_minutes)
         if not self.running:
-            self.current_match_duration_seconds = desired_minutes * 60
+            self.current_match_duration_seconds = self._get_desired_match_seconds()
 
         try:
             cw = max(300, int(self.controller_width_var.get()))
@@ -1181,8 +4354,30 @@ class FussballTimer:
 
         self.hall_buzzer_enabled.set(bool(self.hall_buzzer_enabled_var.get()))
         self.hall_buzzer_file = self.hall_buzzer_file_var.get().strip()
+        if self.hall_buzzer_preset_var.get() in BUZZER_PRESETS:
+            self.hall_buzzer_preset = self.hall_buzzer_preset_var.get()
+
+        try:
+            budget_mb = max(0, int(self.jingle_pool_budget_var.get()))
+        except Exception:
+            budget_mb = self.jingle_pool_budget_mb.get()
+        self.jingle_pool_budget_mb.set(budget_mb)
+        self.jingle_pool.budget_bytes = budget_mb * 1024 * 1024
+        self.jingle_normalize_enabled.set(bool(self.jingle_normalize_var.get()))
+        if self.jingle_start_mode_var.get() in JINGLE_START_MODES:
+            self.jingle_start_mode.set(self.jingle_start_mode_var.get())
+        try:
+            self.audio_frequency.set(int(self.audio_frequency_var.get()))
+            self.audio_buffer.set(int(self.audio_buffer_var.get()))
+            self.audio_channels.set(int(self.audio_channels_var.get()))
+            self.audio_buzzer_channel.set(max(len(JINGLE_CHANNELS), int(self.audio_buzzer_channel_var.get())))
+        except Exception:
+            pass
+        if not self._apply_audio_engine_settings() and self.jingle_paths:
+            self.jingle_pool.preload(self.jingle_paths)
         self._buzzer_sound = None
         self._buzzer_sound_source = None
+        self._prepare_buzzer_cache()
 
         self._save_settings()
 
@@ -1198,7 +4393,7 @@ class FussballTimer:
         if is_turnier:
             if not self.tournament_row.winfo_manager():
                 self.tournament_row.pack(fill="x", padx=10, pady=(5, 0))
-            combobox_state = "readonly" if self.tournament_matches else "disabled"
+            combobox_state = "normal" if self.tournament_plan else "disabled"
             self.match_number_cb.configure(state=combobox_state)
         else:
             if self.tournament_row.winfo_manager():
@@ -1210,43 +4405,382 @@ class FussballTimer:
         if not path:
             return
 
+        self._csv_import_token += 1
+        token = self._csv_import_token
+        self.csv_status_var.set("Importiere … 0 %")
+        self._set_csv_button_state("disabled")
+        threading.Thread(target=self._csv_import_thread, args=(path, token), daemon=True).start()
+
+    def _csv_import_thread(self, path, token):
+        def report(fraction):
+            self.root.after(0, self._report_csv_import, token, fraction)
+
         try:
-            with open(path, "r", encoding="utf-8-sig") as f:
-                reader = csv.DictReader(f)
-                matches = []
-                for row in reader:
-                    nr = (row.get("Nr") or "").strip()
-                    team1 = (row.get("Team1") or "").strip()
-                    team2 = (row.get("Team2") or "").strip()
-                    if not nr:
-                        continue
-                    matches.append({"Nr": nr, "Team1": team1, "Team2": team2})
+            plan, errors = TournamentCsvImporter.run(path, report, lambda: token != self._csv_import_token)
+            failure = None
         except Exception as exc:
-            messagebox.showerror("CSV Import fehlgeschlagen", f"Die Datei konnte nicht geladen werden: {exc}")
+            plan, errors, failure = None, [], exc
+        self.root.after(0, self._finish_csv_import, token, plan, errors, failure)
+
+    def _report_csv_import(self, token, fraction):
+        if token == self._csv_import_token:
+            self.csv_status_var.set(f"Importiere … {int(fraction * 100)} %")
+
+    def _set_csv_button_state(self, state):
+        if hasattr(self, "csv_load_btn") and self.csv_load_btn.winfo_exists():
+            self.csv_load_btn.configure(state=state)
+
+    def _finish_csv_import(self, token, plan, errors, failure):
+        if token != self._csv_import_token:
             return
+        self._set_csv_button_state("normal")
 
-        if not matches:
+        if failure is not None:
+            self.csv_status_var.set("Kein CSV geladen")
+            messagebox.showerror("CSV Import fehlgeschlagen", f"Die Datei konnte nicht geladen werden: {failure}")
+            return
+
+        if not plan:
+            self.csv_status_var.set("Kein CSV geladen")
             messagebox.showwarning("Keine Daten", "In der gewählten CSV wurden keine Spiele gefunden.")
             return
 
-        self.tournament_matches = matches
-        numbers = [m["Nr"] for m in matches]
-        self.match_number_cb.configure(values=numbers, state="readonly")
-        self.match_number_var.set(numbers[0])
-        self.csv_status_var.set(f"{len(matches)} Spiele geladen")
+        self._set_tournament_plan(plan)
+        status = f"{len(plan)} Spiele geladen"
+        if errors:
+            status += f", {len(errors)} Zeilen fehlerhaft"
+            details = "\n".join(f"Zeile {line}: {message}" for line, message in errors[:15])
+            if len(errors) > 15:
+                details += f"\n… und {len(errors) - 15} weitere"
+            messagebox.showwarning("CSV Import mit Fehlern", f"Diese Zeilen wurden übersprungen:\n{details}")
+        self.csv_status_var.set(status)
+
+    def _set_tournament_plan(self, plan):
+        self.tournament_plan = plan
+        self.standings = StandingsTable()
+        for match in plan:
+            self.standings.add_team(match.team1, match.group)
+            self.standings.add_team(match.team2, match.group)
+        self.match_number_cb.configure(state="normal")
+        self.match_number_var.set(plan.first().number)
         self._apply_selected_match()
 
+    def _open_schedule_generator(self):
+        if hasattr(self, "schedule_window") and self.schedule_window.winfo_exists():
+            self.schedule_window.lift()
+            return
+
+        self.schedule_window = tk.Toplevel(self.root)
+        self.schedule_window.title("Spielplan erstellen")
+        self.schedule_window.configure(bg=self.controller_bg_color)
+        self.schedule_window.geometry("460x520")
+
+        self.schedule_groups_var = tk.IntVar(value=1)
+        self.schedule_pitches_var = tk.IntVar(value=1)
+        self.schedule_start_var = tk.StringVar(value="09:00")
+        self.schedule_changeover_var = tk.IntVar(value=2)
+        self.schedule_rest_var = tk.IntVar(value=0)
+        self.schedule_breaks_var = tk.StringVar(value="")
+
+        tk.Label(
+            self.schedule_window,
+            text="Teams (eins pro Zeile)",
+            bg=self.controller_bg_color,
+            fg=self.controller_text_color,
+            font=("Arial", 10, "bold"),
+        ).pack(anchor="w", padx=10, pady=(10, 2))
+        self.schedule_teams_text = tk.Text(self.schedule_window, height=12)
+        self.schedule_teams_text.pack(fill="both", expand=True, padx=10)
+        if self.tournament_plan:
+            self.schedule_teams_text.insert("1.0", "\n".join(self.tournament_plan.teams()))
+
+        options = tk.Frame(self.schedule_window, bg=self.controller_bg_color)
+        options.pack(fill="x", padx=10, pady=8)
+        rows = [
+            ("Gruppen", tk.Spinbox(options, from_=1, to=16, width=5, textvariable=self.schedule_groups_var)),
+            ("Felder", tk.Spinbox(options, from_=1, to=8, width=5, textvariable=self.schedule_pitches_var)),
+            ("Beginn (HH:MM)", tk.Entry(options, width=7, textvariable=self.schedule_start_var)),
+            ("Wechselzeit (Min)", tk.Spinbox(options, from_=0, to=30, width=5, textvariable=self.schedule_changeover_var)),
+            ("Mindestpause je Team (Min)", tk.Spinbox(options, from_=0, to=120, width=5, textvariable=self.schedule_rest_var)),
+            ("Pausen (12:00-12:30, ...)", tk.Entry(options, width=20, textvariable=self.schedule_breaks_var)),
+        ]
+        for row, (label_text, widget) in enumerate(rows):
+            tk.Label(options, text=label_text, bg=self.controller_bg_color, fg=self.controller_text_color)\
+                .grid(row=row, column=0, sticky="w", pady=2)
+            widget.grid(row=row, column=1, sticky="w", padx=6, pady=2)
+        tk.Label(
+            options,
+            text=f"Spiellänge: {self.match_duration_minutes.get()} Min (aus der Spielzeit-Einstellung)",
+            bg=self.controller_bg_color,
+            fg="#666",
+        ).grid(row=len(rows), column=0, columnspan=2, sticky="w", pady=(4, 0))
+
+        tk.Button(
+            self.schedule_window,
+            text="Plan erstellen",
+            command=self._generate_schedule,
+            bg=ACCENT_GREEN,
+            fg=RSK_WHITE,
+            padx=10,
+        ).pack(pady=(0, 10))
+
+    def _generate_schedule(self):
+        teams = self.schedule_teams_text.get("1.0", "end").splitlines()
+        try:
+            plan = ScheduleGenerator.generate(
+                teams,
+                pitches=self.schedule_pitches_var.get(),
+                match_minutes=self.match_duration_minutes.get(),
+                start=self.schedule_start_var.get(),
+                changeover_minutes=self.schedule_changeover_var.get(),
+                rest_minutes=self.schedule_rest_var.get(),
+                breaks=ScheduleGenerator.parse_breaks(self.schedule_breaks_var.get()),
+                groups=self.schedule_groups_var.get(),
+            )
+        except (ValueError, tk.TclError) as exc:
+            messagebox.showerror("Spielplan", str(exc), parent=self.schedule_window)
+            return
+
+        self._csv_import_token += 1
+        self._set_csv_button_state("normal")
+        self._set_tournament_plan(plan)
+        last = list(plan)[-1]
+        self.csv_status_var.set(f"{len(plan)} Spiele erzeugt (bis {last.time})")
+        self.schedule_window.destroy()
+
+    def _multi_pitch_buzzer(self):
+        """Kanal und Hupe für den Mehrfeld-Betrieb (None, wenn keine Hupe laufen soll)."""
+        if not self.hall_buzzer_enabled.get() or not pygame.mixer.get_init():
+            return None
+        sound = self._ensure_buzzer_sound()
+        channel = self.audio_engine.get_buzzer_channel()
+        if sound is None or channel is None:
+            return None
+        return channel, sound
+
+    def open_multi_pitch(self):
+        if hasattr(self, "multi_pitch_window") and self.multi_pitch_window.winfo_exists():
+            self.multi_pitch_window.lift()
+            return
+
+        self.multi_pitch_window = tk.Toplevel(self.root)
+        self.multi_pitch_window.title("Mehrfeld-Betrieb")
+        self.multi_pitch_window.configure(bg=self.controller_bg_color)
+        self.multi_pitch_window.protocol("WM_DELETE_WINDOW", self._close_multi_pitch)
+
+        self.multi_pitch = MultiPitchController(
+            self.root,
+            self._multi_pitch_buzzer,
+            on_render=self._render_pitch_row,
+            on_match_end=self._record_pitch_result,
+        )
+        self.pitch_rows = {}
+
+        top = tk.Frame(self.multi_pitch_window, bg=self.controller_bg_color)
+        top.pack(fill="x", padx=10, pady=(10, 4))
+        tk.Label(top, text="Felder:", bg=self.controller_bg_color, fg=self.controller_text_color).pack(side="left")
+        plan_pitches = [pitch for pitch in self.tournament_plan.pitches() if pitch]
+        self.multi_pitch_count_var = tk.IntVar(value=min(6, max(2, len(plan_pitches))))
+        tk.Spinbox(top, from_=2, to=6, width=3, textvariable=self.multi_pitch_count_var).pack(side="left", padx=4)
+        tk.Button(top, text="Übernehmen", command=self._build_pitch_rows).pack(side="left", padx=4)
+
+        self.pitch_rows_frame = tk.Frame(self.multi_pitch_window, bg=self.controller_bg_color)
+        self.pitch_rows_frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        self._build_pitch_rows()
+
+    def _build_pitch_rows(self):
+        try:
+            count = max(2, min(6, int(self.multi_pitch_count_var.get())))
+        except (ValueError, tk.TclError):
+            count = 2
+        self._teardown_pitches()
+        for child in self.pitch_rows_frame.winfo_children():
+            child.destroy()
+
+        # Felder in der Reihenfolge des Plans seinen Bezeichnungen zuordnen
+        plan_pitches = [pitch for pitch in self.tournament_plan.pitches() if pitch]
+        for index in range(count):
+            scoreboard = ScoreboardDisplay(
+                self.root,
+                bg_color=self.scoreboard_bg_color,
+                text_color=self.scoreboard_text_color,
+                board_title=self.scoreboard_title,
+            )
+            pitch = self.multi_pitch.add_pitch(scoreboard)
+            if index < len(plan_pitches):
+                pitch.plan_key = plan_pitches[index]
+            scoreboard.set_board_title(f"{self.scoreboard_title} – {pitch.label}")
+            scoreboard.show()
+            self._create_pitch_row(pitch)
+            self.multi_pitch.set_match(pitch, "Heim", "Gast", self.match_duration_minutes.get() * 60)
+
+    def _create_pitch_row(self, pitch):
+        row = tk.Frame(self.pitch_rows_frame, bg=self.controller_card_bg, bd=1, relief="flat")
+        row.pack(fill="x", pady=4, ipady=4)
+        widgets = {}
+
+        tk.Label(row, text=pitch.label, font=("Arial", 12, "bold"), bg=self.controller_card_bg, fg=RSK_BLUE)\
+            .grid(row=0, column=0, padx=8, sticky="w")
+        match_var = tk.StringVar()
+        widgets["match_var"] = match_var
+        matches = self.tournament_plan.matches_on_pitch(pitch.plan_key)
+        match_cb = ttk.Combobox(row, textvariable=match_var, values=[match.label() for match in matches], width=40, state="readonly")
+        match_cb.grid(row=0, column=1, columnspan=4, padx=4, sticky="w")
+        match_cb.bind("<<ComboboxSelected>>", lambda _event, p=pitch: self._apply_pitch_match(p))
+        self._text_btn(row, "Nächstes", lambda p=pitch: self._next_pitch_match(p)).grid(row=0, column=5, padx=4)
+
+        widgets["teams"] = tk.Label(row, font=("Arial", 11, "bold"), bg=self.controller_card_bg, fg=self.controller_text_color)
+        widgets["teams"].grid(row=1, column=0, columnspan=2, padx=8, sticky="w")
+        widgets["time"] = tk.Label(row, font=("Impact", 28), bg=self.controller_card_bg, fg=RSK_BLUE, width=6)
+        widgets["time"].grid(row=1, column=2, padx=4)
+        widgets["score"] = tk.Label(row, font=("Arial", 20, "bold"), bg=self.controller_card_bg, fg=self.controller_text_color, width=5)
+        widgets["score"].grid(row=1, column=3, padx=4)
+
+        goals = tk.Frame(row, bg=self.controller_card_bg)
+        goals.grid(row=1, column=4, padx=4)
+        for side, text in ((0, "Heim"), (1, "Gast")):
+            tk.Button(goals, text=f"{text} +", width=6, command=lambda p=pitch, s=side: self.multi_pitch.add_goal(p, s, 1))\
+                .grid(row=0, column=side, padx=1)
+            tk.Button(goals, text=f"{text} −", width=6, command=lambda p=pitch, s=side: self.multi_pitch.add_goal(p, s, -1))\
+                .grid(row=1, column=side, padx=1)
+
+        controls = tk.Frame(row, bg=self.controller_card_bg)
+        controls.grid(row=1, column=5, padx=4)
+        tk.Button(controls, text="START", bg=ACCENT_GREEN, fg=RSK_WHITE, width=6, command=lambda p=pitch: self.multi_pitch.start(p)).pack(side="left", padx=1)
+        tk.Button(controls, text="STOPP", bg=ACCENT_RED, fg=RSK_WHITE, width=6, command=lambda p=pitch: self.multi_pitch.stop(p)).pack(side="left", padx=1)
+        self._text_btn(controls, "Reset", lambda p=pitch: self.multi_pitch.reset(p)).pack(side="left", padx=1)
+
+        self.pitch_rows[pitch.number] = widgets
+
+    def _render_pitch_row(self, pitch, time_text, color, status):
+        widgets = self.pitch_rows.get(pitch.number)
+        if not widgets:
+            return
+        widgets["teams"].config(text=f"{pitch.teams[0]} – {pitch.teams[1]}  ({status})")
+        widgets["time"].config(text=time_text, fg=ACCENT_RED if color == ACCENT_RED else RSK_BLUE)
+        widgets["score"].config(text=f"{pitch.scores[0]}:{pitch.scores[1]}")
+
+    def _apply_pitch_match(self, pitch):
+        label = self.pitch_rows[pitch.number]["match_var"].get()
+        match = self.tournament_plan.match_for_label(label)
+        if not match:
+            return
+        if pitch.running:
+            messagebox.showinfo("Mehrfeld-Betrieb", f"Auf {pitch.label} läuft noch ein Spiel.", parent=self.multi_pitch_window)
+            return
+        duration = (match.duration or self.match_duration_minutes.get()) * 60
+        self.multi_pitch.set_match(pitch, match.team1, match.team2, duration, match)
+
+    def _next_pitch_match(self, pitch):
+        matches = self.tournament_plan.matches_on_pitch(pitch.plan_key)
+        if not matches:
+            return
+        if pitch.match in matches:
+            position = matches.index(pitch.match) + 1
+            if position >= len(matches):
+                return
+        else:
+            position = 0
+        self.pitch_rows[pitch.number]["match_var"].set(matches[position].label())
+        self._apply_pitch_match(pitch)
+
+    def _record_pitch_result(self, pitch):
+        match = pitch.match
+        if match is None:
+            return
+        self.standings.record(match.number, match.team1, match.team2, pitch.scores[0], pitch.scores[1], match.group)
+        self._refresh_standings_view()
+
+    def _teardown_pitches(self):
+        if not hasattr(self, "multi_pitch"):
+            return
+        self.multi_pitch.shutdown()
+        for pitch in self.multi_pitch.pitches:
+            try:
+                pitch.scoreboard.window.destroy()
+            except tk.TclError:
+                pass
+        self.multi_pitch.pitches.clear()
+        self.pitch_rows = {}
+
+    def _close_multi_pitch(self):
+        self._teardown_pitches()
+        self.multi_pitch_window.destroy()
+
+    def _filter_match_choices(self):
+        """Füllt die Combobox erst beim Aufklappen, gefiltert nach dem eingegebenen Text."""
+        text = self.match_number_var.get()
+        if self.tournament_plan.get(text.strip()):
+            text = ""
+        self.match_number_cb.configure(values=self.tournament_plan.filter_labels(text))
+
     def _apply_selected_match(self, event=None):
-        if not self.tournament_matches:
+        if not self.tournament_plan:
             return
 
-        selected_nr = self.match_number_var.get().strip()
-        match = next((m for m in self.tournament_matches if m["Nr"] == selected_nr), None)
+        match = self.tournament_plan.match_for_label(self.match_number_var.get())
         if not match:
             messagebox.showwarning("Unbekannte Spielnummer", "Bitte wähle eine gültige Spielnummer aus der CSV.")
             return
 
-        self._set_team_names(match.get("Team1", ""), match.get("Team2", ""))
+        self.match_number_var.set(match.number)
+        self.current_match = match
+        self._set_team_names(match.team1, match.team2)
+        if not self.running and self.seconds == 0:
+            # Eigene Spiellänge gilt nur für dieses Spiel, die Einstellung bleibt
+            self.current_match_duration_seconds = self._get_desired_match_seconds()
+        self._refresh_standings_view()
+
+    def _record_match_result(self):
+        """Übernimmt den Endstand des laufenden Turnierspiels in die Tabelle."""
+        match = self.current_match
+        if (
+            self.match_mode.get() != "halle_turnier"
+            or match is None
+            or (self.team_home_name, self.team_away_name) != (match.team1, match.team2)
+        ):
+            return False
+        self.standings.record(
+            match.number,
+            match.team1,
+            match.team2,
+            self.scores[self.team_home_name],
+            self.scores[self.team_away_name],
+            match.group,
+        )
+        self._refresh_standings_view()
+        return True
+
+    def _standings_lines(self, group, limit=16):
+        lines = [f"{'':>3} {'Team':<22} {'Sp':>2} {'S':>2} {'U':>2} {'N':>2} {'Tore':^7} {'Diff':>4} {'Pkt':>3}"]
+        rows = self.standings.rows(group)
+        if len(rows) > limit and self.current_match:
+            # Die Teams des aktuellen Spiels sollen immer sichtbar bleiben
+            missing = [row for row in rows[limit:] if row[1].team in self.current_match.teams]
+            rows = rows[:limit - len(missing)] + missing
+        for rank, record in rows:
+            lines.append(
+                f"{rank:>2}. {record.team[:22]:<22} {record.played:>2} {record.won:>2} {record.drawn:>2} {record.lost:>2} "
+                f"{record.goals_for:>3}:{record.goals_against:<3} {record.goal_difference:>+4} {record.points:>3}"
+            )
+        return lines
+
+    def _refresh_standings_view(self, force=False):
+        if not force and not self.scoreboard.standings_visible():
+            return
+        group = self.current_match.group if self.current_match else ""
+        title = f"TABELLE GRUPPE {group}" if group else "TABELLE"
+        self.scoreboard.show_standings(title, self._standings_lines(group))
+
+    def toggle_standings(self):
+        if self.scoreboard.standings_visible():
+            self.scoreboard.hide_standings()
+            return
+        if self.running:
+            messagebox.showinfo("Tabelle", "Die Tabelle kann zwischen den Spielen angezeigt werden.")
+            return
+        self._refresh_standings_view(force=True)
+        self.scoreboard.show()
 
 
     def _create_card_timer(self, parent):
@@ -1320,9 +4854,18 @@ class FussballTimer:
         self.tournament_row = tk.Frame(self.score_card, bg=self.controller_card_bg)
         self.tournament_row.pack(fill="x", padx=10, pady=(5, 0))
         tk.Label(self.tournament_row, text="Hallen Turnier Nr:", bg=self.controller_card_bg, fg=self.controller_text_color).pack(side="left")
-        self.match_number_cb = ttk.Combobox(self.tournament_row, textvariable=self.match_number_var, state="disabled", width=8)
+        self.match_number_cb = ttk.Combobox(
+            self.tournament_row,
+            textvariable=self.match_number_var,
+            state="disabled",
+            width=12,
+            postcommand=self._filter_match_choices,
+        )
         self.match_number_cb.pack(side="left", padx=4)
         self.match_number_cb.bind("<<ComboboxSelected>>", self._apply_selected_match)
+        self.match_number_cb.bind("<Return>", self._apply_selected_match)
+        self._text_btn(self.tournament_row, "Tabelle", self.toggle_standings).pack(side="right")
+        self._text_btn(self.tournament_row, "Mehrere Felder", self.open_multi_pitch).pack(side="right")
         tk.Label(self.tournament_row, textvariable=self.csv_status_var, bg=self.controller_card_bg, fg="#666").pack(side="left", padx=6)
 
     def _create_card_audio(self, parent):
@@ -1355,6 +4898,7 @@ class FussballTimer:
         self.audio_ctrl_frame = tk.Frame(self.audio_card, bg=self.controller_card_bg)
         self.audio_ctrl_frame.pack(pady=5)
         self._icon_btn(self.audio_ctrl_frame, "📂 Wählen", self.choose_jingle, "#6c757d").pack(side="left", padx=2)
+        self._icon_btn(self.audio_ctrl_frame, "📚 Bibliothek", self.open_jingle_library, "#6c757d").pack(side="left", padx=2)
         self._icon_btn(self.audio_ctrl_frame, "▶ PLAY", self.play_jingle, ACCENT_GREEN).pack(side="left", padx=2)
         self._icon_btn(self.audio_ctrl_frame, "■ STOP", self.stop_jingle, ACCENT_RED).pack(side="left", padx=2)
 
@@ -1362,6 +4906,7 @@ class FussballTimer:
         self.audio_vis_frame.pack(fill="x")
         self.wave_canvas = tk.Canvas(self.audio_vis_frame, height=80, bg="#FAFAFA", highlightthickness=0)
         self.wave_canvas.pack(fill="x")
+        self.waveform = WaveformRenderer(self.wave_canvas)
 
         leg = tk.Frame(self.audio_vis_frame, bg=self.controller_card_bg)
         leg.pack(fill="x", pady=2)
@@ -1380,40 +4925,22 @@ class FussballTimer:
         self.progress.pack(fill="x", pady=(5, 0))
 
 
-    def _generate_buzzer_wave(self, path, duration=3.5, base_freq=160):
+    def _generate_buzzer_wave(self, path, preset=None):
         sample_rate = 22050
-        amplitude = 32767
-        total_samples = int(sample_rate * duration)
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
+        frames = self.buzzer_synth.render(preset or self.hall_buzzer_preset, sample_rate, 1)
+        if sys.byteorder != "little":
+            samples = array("h", frames)
+            samples.byteswap()
+            frames = samples.tobytes()
 
         with wave.open(str(path), "w") as wav_file:
-            wav_file.setparams((1, 2, sample_rate, total_samples, "NONE", "not compressed"))
-            for i in range(total_samples):
-                t = i / sample_rate
-                wobble = base_freq * 0.012 * math.sin(2 * math.pi * 1.4 * t)
-                freq = base_freq + wobble
-
-                angle = 2 * math.pi * freq * t
-
-                attack = 0.08
-                sustain = 2.4
-                release = 0.6
-
-                if t < attack:
-                    envelope = t / attack
-                elif t < sustain:
-                    envelope = 1.0
-                elif t < duration - release:
-                    envelope = 0.85
-                else:
-                    envelope = max(0.0, 0.85 * (1 - (t - (duration - release)) / release))
-
-                tone = (0.82 * math.sin(angle) + 0.35 * math.sin(angle * 2)) * 0.7
-                value = int(amplitude * envelope * tone)
-                wav_file.writeframes(struct.pack("<h", value))
+            wav_file.setparams((1, 2, sample_rate, len(frames) // 2, "NONE", "not compressed"))
+            wav_file.writeframes(frames)
 
     def _resolve_buzzer_source(self, preferred_path=None):
+        """Liefert die gewählte Hupen-Datei oder None für die synthetische Hupe."""
         candidate = Path(preferred_path).expanduser() if preferred_path else None
         if candidate and candidate.exists():
             return candidate
@@ -1422,23 +4949,119 @@ class FussballTimer:
         if stored and stored.exists():
             return stored
 
-        fallback = Path(self.settings_path).with_name("hall_buzzer.wav")
+        return None
+
+    def _apply_audio_engine_settings(self):
+        """Startet den Mixer neu, wenn sich die Engine-Werte geändert haben."""
+        changed = self.audio_engine.configure(
+            self.audio_frequency.get(),
+            self.audio_buffer.get(),
+            self.audio_channels.get(),
+            self.audio_buzzer_channel.get(),
+        )
+        if not changed:
+            return False
+
+        self.stop_jingle()
+        self.jingle_pool.clear()
+        # Geplante Hupen halten Kanal und Sound des alten Mixers
+        self.buzzer_scheduler.cancel()
+        if hasattr(self, "multi_pitch"):
+            self.multi_pitch.buzzer.cancel()
+        self._buzzer_sound = None
+        self._buzzer_sound_source = None
+        if not self.audio_engine.start():
+            messagebox.showerror("Fehler", "Pygame Mixer konnte nicht neu gestartet werden. Audiofunktionen sind deaktiviert.")
+            return True
+        self.audio_engine.reserve_channels()
+        self.channel_mixer.attach()
+        if self.jingle_paths:
+            self.jingle_pool.preload(self.jingle_paths)
+        self._prepare_buzzer_cache()
+        if self.running:
+            self._sync_buzzer_schedule()
+        if hasattr(self, "multi_pitch"):
+            self.multi_pitch.sync_buzzer()
+        return True
+
+    @staticmethod
+    def _format_latency_probe(result):
+        if not result:
+            return "Noch nicht gemessen"
+        return (
+            f"ca. {result['estimated_ms']:.0f} ms (play() {result['call_ms']:.2f} ms, Puffer {result['buffer_ms']:.1f} ms), "
+            f"Jitter {result['jitter_ms']:.1f} ms → Vorschlag: Puffer {result['suggested_buffer']}"
+        )
+
+    def _run_latency_probe(self):
+        if not pygame.mixer.get_init():
+            self.audio_probe_var.set("Mixer nicht aktiv")
+            return
+        if self.running:
+            # Die Messung belastet Mixer und CPU; nicht während eines Spiels
+            self.audio_probe_var.set("Nur bei angehaltener Spieluhr möglich")
+            return
+        self.audio_probe_var.set("Messe …")
+        self._latency_probe_running = True
+        self.audio_probe_btn.config(state="disabled")
+
+        def worker():
+            try:
+                result = self.audio_engine.probe_latency()
+            except Exception:
+                result = None
+            self.root.after(0, self._finish_latency_probe, result)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _set_probe_button_state(self, state):
+        if hasattr(self, "audio_probe_btn") and self.audio_probe_btn.winfo_exists():
+            self.audio_probe_btn.config(state=state)
+
+    def _finish_latency_probe(self, result):
+        self._latency_probe_running = False
+        if not hasattr(self, "settings_window") or not self.settings_window.winfo_exists():
+            return
+        self._set_probe_button_state("disabled" if self.running else "normal")
+        self.audio_probe_var.set(self._format_latency_probe(result) if result else "Messung fehlgeschlagen")
+        if result:
+            # Vorschlag nur ins Formular übernehmen; aktiv wird er mit dem Speichern
+            self.audio_buffer_var.set(result["suggested_buffer"])
+
+    def _prepare_buzzer_cache(self):
+        """Bringt eine eigene Hupen-Datei im Hintergrund ins Mixer-Format."""
+        source = self._resolve_buzzer_source()
+        if source is not None and pygame.mixer.get_init():
+            self.resample_cache.prepare([str(source)])
+
+    def _create_synth_buzzer_sound(self, preset):
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        if sample_format == -16:
+            return pygame.mixer.Sound(buffer=self.buzzer_synth.render(preset, frequency, channels))
+
+        # Exotisches Mixer-Format: einmalig als WAV ablegen und SDL konvertieren lassen
+        fallback = Path(self.settings_path).with_name(f"hall_buzzer_{preset}.wav")
         if not fallback.exists():
-            self._generate_buzzer_wave(fallback)
-        return fallback
+            self._generate_buzzer_wave(fallback, preset)
+        return pygame.mixer.Sound(str(fallback))
 
-    def _ensure_buzzer_sound(self, preferred_path=None):
+    def _ensure_buzzer_sound(self, preferred_path=None, preferred_preset=None):
         if not pygame.mixer.get_init():
             return None
 
         source = self._resolve_buzzer_source(preferred_path)
+        preset = preferred_preset if preferred_preset in BUZZER_PRESETS else self.hall_buzzer_preset
+        source_key = source if source is not None else ("synth", preset)
 
-        if self._buzzer_sound and self._buzzer_sound_source == source:
+        if self._buzzer_sound and self._buzzer_sound_source == source_key:
             return self._buzzer_sound
 
         try:
-            self._buzzer_sound = pygame.mixer.Sound(str(source))
-            self._buzzer_sound_source = source
+            if source is None:
+                self._buzzer_sound = self._create_synth_buzzer_sound(preset)
+            else:
+                self._buzzer_sound = self.resample_cache.load_sound(source) or pygame.mixer.Sound(str(source))
+            self._buzzer_sound_source = source_key
         except Exception:
             self._buzzer_sound = None
             self._buzzer_sound_source = None
@@ -1446,19 +5069,105 @@ class FussballTimer:
         return self._buzzer_sound
 
     def _play_hall_buzzer(self):
+        """Spielt die Hupe; liefert ihre Länge in Sekunden (0, wenn keine Hupe lief)."""
         if not self.hall_buzzer_enabled.get():
-            return
+            return 0
 
         sound = self._ensure_buzzer_sound()
         if sound:
             try:
-                sound.play()
+                channel = self.audio_engine.get_buzzer_channel()
+                if channel is not None:
+                    channel.play(sound)
+                else:
+                    sound.play()
+                return sound.get_length()
             except Exception:
                 pass
+        return 0
+
+    def _sync_buzzer_schedule(self):
+        """Plant die Hupe auf das Spielende; neu, sobald sich Frist oder Einstellungen ändern."""
+        deadline = self.clock.deadline_for(self.current_match_duration_seconds)
+        wanted = (
+            deadline is not None
+            and self.match_mode.get() in ("halle", "halle_turnier")
+            and self.hall_buzzer_enabled.get()
+            and bool(pygame.mixer.get_init())
+        )
+        if not wanted:
+            if self.buzzer_scheduler.armed:
+                self.buzzer_scheduler.cancel()
+            return
+        if self.buzzer_scheduler.fired or (
+            self.buzzer_scheduler.armed and abs(self.buzzer_scheduler.deadline - deadline) < 0.001
+        ):
+            return
+        if deadline <= time.monotonic():
+            return
+        sound = self._ensure_buzzer_sound()
+        channel = self.audio_engine.get_buzzer_channel()
+        if sound is None or channel is None:
+            return
+        self.buzzer_scheduler.arm(deadline, channel, sound, self._on_buzzer_fired)
+
+    def _on_buzzer_fired(self, deadline, fired_at):
+        """Läuft im Hupen-Thread: Jingle sofort absenken, Anzeige und Protokoll im Tk-Thread."""
+        sound = self._buzzer_sound
+        self.channel_mixer.duck(BUZZER_DUCK_LEVEL)
+        self.channel_mixer.fade_out(MATCH_END_FADE_SECONDS, delay=sound.get_length() if sound else 0.0)
+        self.root.after(0, self._handle_buzzer_fired, deadline, fired_at)
+
+    def _handle_buzzer_fired(self, deadline, fired_at):
+        self._log_buzzer_offset(deadline, fired_at, "geplant")
+        if self.running:
+            # Anzeige nicht bis zum nächsten Tick warten lassen
+            self._cancel_tick()
+            self._tick()
+
+    def _log_buzzer_offset(self, deadline, fired_at, source):
+        """Hängt die Abweichung der Hupe vom Spielende an buzzer_log.csv an."""
+        match_label = f"{self.team_home_name} - {self.team_away_name}"
+        if self.match_number_var.get():
+            match_label = f"{self.match_number_var.get()}: {match_label}"
+        row = [
+            time.strftime("%Y-%m-%d %H:%M:%S"),
+            match_label,
+            self.current_match_duration_seconds,
+            f"{(fired_at - deadline) * 1000:.2f}",
+            source,
+        ]
+        try:
+            is_new = not self.buzzer_log_path.exists()
+            self.buzzer_log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.buzzer_log_path, "a", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f, delimiter=";")
+                if is_new:
+                    writer.writerow(["zeit", "spiel", "dauer_s", "abweichung_ms", "ausloesung"])
+                writer.writerow(row)
+        except Exception:
+            pass
+
+    def _end_match_audio(self):
+        """Spielende: Jingle unter der Hupe absenken und danach kurz ausblenden statt hart zu stoppen."""
+        self._cancel_jingle_prefetch()
+        deadline = self.buzzer_scheduler.deadline
+        if self.buzzer_scheduler.cancel():
+            # Hupe und Ducking liefen bereits exakt zum Spielende im Hupen-Thread
+            return
+        buzzer_length = self._play_hall_buzzer()
+        if buzzer_length and deadline is not None:
+            self._log_buzzer_offset(deadline, time.monotonic(), "tick")
+        if buzzer_length:
+            self.channel_mixer.duck(BUZZER_DUCK_LEVEL)
+            self.channel_mixer.fade_out(MATCH_END_FADE_SECONDS, delay=buzzer_length)
+        else:
+            self.channel_mixer.fade_out(MATCH_END_FADE_SECONDS)
 
     def _play_buzzer_preview(self):
         preferred_path = self.hall_buzzer_file_var.get() if hasattr(self, "hall_buzzer_file_var") else None
-        sound = self._ensure_buzzer_sound(preferred_path)
+        preferred_preset = self.hall_buzzer_preset_var.get() if hasattr(self, "hall_buzzer_preset_var") else None
+        sound = self._ensure_buzzer_sound(preferred_path, preferred_preset)
         if sound:
             try:
                 sound.play()
@@ -1466,6 +5175,9 @@ class FussballTimer:
                 pass
 
     def _get_desired_match_seconds(self):
+        match = self.current_match
+        if self.match_mode.get() == "halle_turnier" and match is not None and match.duration:
+            return match.duration * 60
         try:
             minutes = self.match_duration_minutes.get()
             return max(1, minutes) * 60
@@ -1486,13 +5198,24 @@ class FussballTimer:
                 self.timer_label.config(fg=RSK_BLUE)
 
             self.running = True
+            self.clock.start()
+            self._set_probe_button_state("disabled")
+            self._sync_buzzer_schedule()
+            self.scoreboard.hide_standings()
             if self.scoreboard_enabled.get():
                 self.scoreboard.show()
+            self._cancel_tick()
             self._tick()
             
     def stop_timer(self):
         if self.running:
             self.running = False
+            self.clock.pause()
+            self._set_probe_button_state("disabled" if self._latency_probe_running else "normal")
+            self.buzzer_scheduler.cancel()
+            self._cancel_tick()
+            self.seconds = self.clock.whole_seconds()
+            self.timer_label.config(text=f"{self.seconds // 60}:{self.seconds % 60:02}")
             pause_text = f"{self._get_half_prefix()} PAUSE"
             self.half_label.config(text=pause_text)
             self._update_scoreboard_display(self.timer_label['fg'], pause_text)
@@ -1505,6 +5228,7 @@ class FussballTimer:
         self.stop_jingle()
         self.stop_timer()
         self.seconds = 0
+        self.clock.set_elapsed(0)
         self.jingle_triggered = False
         self.current_half = 1
         self.current_match_duration_seconds = self._get_desired_match_seconds()
@@ -1519,9 +5243,20 @@ class FussballTimer:
         self._update_scoreboard_display(RSK_BLUE, "SPIEL BEREIT") 
 
     
+    def _cancel_tick(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
     def _tick(self):
+        self._after_id = None
         if self.running:
-            self.seconds += 1
+            # Spielzeit aus dem monotonen Anker ableiten; nach einem hängenden
+            # Tk-Loop springt die Anzeige direkt auf den korrekten Wert.
+            self.seconds = self.clock.whole_seconds()
             minutes = self.seconds // 60
             seconds_part = self.seconds % 60
 
@@ -1530,25 +5265,34 @@ class FussballTimer:
             half_text = f"{self._get_half_prefix()} LÄUFT"
 
             if self.match_mode.get() in ("halle", "halle_turnier"):
+                self._sync_buzzer_schedule()
                 last_minute_threshold = target_time - 60
                 if self.seconds >= last_minute_threshold:
                     color_to_use = ACCENT_RED
 
                     if not self.jingle_triggered and self.jingle_paths and self.auto_jingle_enabled.get():
-                        path_to_play = random.choice(self.jingle_paths)
+                        path_to_play = self._take_prefetched_jingle() or random.choice(self.jingle_paths)
                         self.start_jingle_load_and_play(path_to_play)
                         self.jingle_triggered = True
+                elif self.seconds >= last_minute_threshold - JINGLE_PREFETCH_LEAD_SECONDS:
+                    self._prefetch_auto_jingle()
 
                 if self.seconds >= target_time:
                     self.running = False
-                    self.stop_jingle()
+                    self.clock.pause()
+                    self._set_probe_button_state("disabled" if self._latency_probe_running else "normal")
+                    self.seconds = target_time
+                    self.clock.set_elapsed(target_time)
+                    minutes = self.seconds // 60
+                    seconds_part = self.seconds % 60
                     end_color = ACCENT_RED if color_to_use == ACCENT_RED else "#FF8C00"
                     time_str = f"{minutes}:{seconds_part:02}"
                     self.timer_label.config(text=time_str, fg=end_color)
                     self.half_label.config(text="SPIEL ENDE")
 
                     self._update_scoreboard_display(end_color, "SPIEL ENDE")
-                    self._play_hall_buzzer()
+                    self._end_match_audio()
+                    self._record_match_result()
                     return
             else:
                 if self.seconds >= target_time:
@@ -1559,7 +5303,7 @@ class FussballTimer:
 
             self._update_scoreboard_display(color_to_use, half_text)
 
-            self._after_id = self.root.after(1000, self._tick)
+            self._after_id = self.root.after(self.clock.ms_until_next_second(), self._tick)
 
     def _update_scoreboard_display(self, time_color, half_text):
         minutes = self.seconds // 60
@@ -1586,6 +5330,10 @@ class FussballTimer:
             
         self.scores[t_name] = max(0, self.scores[t_name] + val)
         lbl.config(text=str(self.scores[t_name]))
+
+        # Korrektur nach Abpfiff: gemeldetes Ergebnis ersetzen
+        if not self.running and self.current_match and self.standings.result(self.current_match.number):
+            self._record_match_result()
             
         self._update_scoreboard_display(self.timer_label['fg'], self.half_label['text']) 
 
@@ -1595,148 +5343,402 @@ class FussballTimer:
         else:
             self.start_timer()
 
-    # --- AUDIO/VISUALISIERUNG LOGIK (Unverändert) ---
+    # --- AUDIO/VISUALISIERUNG LOGIK ---
     def choose_jingle(self):
         paths = filedialog.askopenfilenames(filetypes=[("WAV Datei", "*.wav")])
         if not paths: return
-        self.jingle_paths = list(paths)
+        self._set_jingle_selection(paths)
+        self._save_settings()
 
+    def _jingle_selection_label(self):
         count = len(self.jingle_paths)
-        self.file_label.config(text=f"{count} Jingle{'s' if count != 1 else ''} geladen")
-        
+        label = f"{count} Jingle{'s' if count != 1 else ''} geladen"
+        if self.jingle_categories:
+            label += f" ({', '.join(self.jingle_categories)})"
+        return label
+
+    def _set_jingle_selection(self, paths, categories=(), show_first=True):
+        """Übernimmt eine Jingle-Auswahl (Einzeldateien oder Bibliothekskategorien)."""
+        self.jingle_paths = list(paths)
+        self.jingle_categories = list(categories)
+        self.file_label.config(text=self._jingle_selection_label())
+        self.jingle_pool.preload(self.jingle_paths)
+        self._start_loudness_scan(self.jingle_paths)
+        if not show_first or self.jingle_playing:
+            return
+
         if self.jingle_paths:
             path_to_analyze = self.jingle_paths[0]
             self.current_jingle_path = path_to_analyze 
-            self.wave_canvas.delete("all")
-            self.wave_canvas.create_text(self.wave_canvas.winfo_width()/2, 40, text="Lade Visualisierungsdaten...", fill="#999")
-            threading.Thread(target=self._analyze_wav_thread, args=(path_to_analyze, False), daemon=True).start()
+            self.waveform.show_message("Lade Visualisierungsdaten...")
+            self._load_jingle_analysis(path_to_analyze, False)
         else:
             self.wave_reduced = None
             self.wave_duration = 0
-            self.wave_canvas.delete("all")
+            self._wave_full = (None, 0)
+            self.waveform.clear()
+
+    def _restore_jingle_selection(self):
+        """Stellt die zuletzt gewählten Kategorien bzw. Einzeldateien wieder her."""
+        if self.jingle_categories:
+            paths = self.jingle_library.paths_for_categories(self.jingle_categories)
+        else:
+            paths = [path for path in self._saved_jingle_paths if os.path.exists(path)]
+        if paths:
+            self._set_jingle_selection(paths, self.jingle_categories)
+
+    def open_jingle_library(self):
+        if hasattr(self, "library_window") and self.library_window.winfo_exists():
+            self.library_window.lift()
+            return
+
+        self.library_window = tk.Toplevel(self.root)
+        self.library_window.title("Jingle-Bibliothek")
+        self.library_window.configure(bg=self.controller_bg_color)
+        self.library_window.geometry("560x480")
+        self.library_status_var = tk.StringVar(value="")
+
+        folder_section = tk.LabelFrame(self.library_window, text="Überwachte Ordner", bg=self.controller_bg_color, fg=self.controller_text_color)
+        folder_section.pack(fill="x", padx=10, pady=5)
+        self.library_folder_list = tk.Listbox(folder_section, height=4, exportselection=False)
+        self.library_folder_list.pack(fill="x", padx=5, pady=5)
+
+        folder_buttons = tk.Frame(folder_section, bg=self.controller_bg_color)
+        folder_buttons.pack(fill="x", padx=5, pady=(0, 5))
+        tk.Button(folder_buttons, text="Ordner hinzufügen", command=self._add_library_folder, bg=ACCENT_GREEN, fg=RSK_WHITE).pack(side="left")
+        tk.Button(folder_buttons, text="Entfernen", command=self._remove_library_folder, bg=self.controller_card_bg, fg=self.controller_text_color)\
+            .pack(side="left", padx=6)
+        tk.Button(folder_buttons, text="Neu scannen", command=self._rescan_library, bg=self.controller_card_bg, fg=self.controller_text_color)\
+            .pack(side="left")
+        tk.Label(folder_buttons, textvariable=self.library_status_var, bg=self.controller_bg_color, fg="#666").pack(side="left", padx=6)
+
+        category_section = tk.LabelFrame(self.library_window, text="Kategorien", bg=self.controller_bg_color, fg=self.controller_text_color)
+        category_section.pack(fill="both", expand=True, padx=10, pady=5)
+        self.library_category_list = tk.Listbox(category_section, selectmode="extended", exportselection=False)
+        self.library_category_list.pack(fill="both", expand=True, padx=5, pady=5)
+
+        tk.Button(
+            self.library_window,
+            text="Auswahl übernehmen",
+            command=self._apply_library_selection,
+            bg=ACCENT_GREEN,
+            fg=RSK_WHITE,
+            padx=10,
+        ).pack(pady=(0, 10))
+
+        self._refresh_library_window()
+
+    def _refresh_library_window(self):
+        if not hasattr(self, "library_window") or not self.library_window.winfo_exists():
+            return
+
+        self.library_folder_list.delete(0, "end")
+        for folder in self.jingle_library_folders:
+            self.library_folder_list.insert("end", folder)
+
+        self._library_categories = self.jingle_library.categories()
+        self.library_category_list.delete(0, "end")
+        for index, (category, count) in enumerate(self._library_categories):
+            self.library_category_list.insert("end", f"{category} ({count})")
+            if category in self.jingle_categories:
+                self.library_category_list.selection_set(index)
+
+        if self.jingle_library.scanning:
+            self.library_status_var.set("Scan läuft …")
+        else:
+            self.library_status_var.set(f"{self.jingle_library.file_count()} Dateien im Katalog")
+
+    def _add_library_folder(self):
+        folder = filedialog.askdirectory(title="Jingle-Ordner hinzufügen", parent=self.library_window)
+        if not folder or folder in self.jingle_library_folders:
+            return
+        self.jingle_library_folders.append(folder)
+        self._save_settings()
+        self._rescan_library()
+        self._refresh_library_window()
+
+    def _remove_library_folder(self):
+        selection = self.library_folder_list.curselection()
+        if not selection:
+            return
+        del self.jingle_library_folders[selection[0]]
+        self._save_settings()
+        self._rescan_library()
+        self._refresh_library_window()
+
+    def _apply_library_selection(self):
+        categories = [self._library_categories[index][0] for index in self.library_category_list.curselection()]
+        paths = self.jingle_library.paths_for_categories(categories)
+        if not paths:
+            messagebox.showinfo("Jingle-Bibliothek", "Die Auswahl enthält keine Dateien.", parent=self.library_window)
+            return
+        self._set_jingle_selection(paths, categories)
+        self._save_settings()
+
+    def _rescan_library(self):
+        if self._library_rescan_id is not None:
+            self.root.after_cancel(self._library_rescan_id)
+            self._library_rescan_id = None
+        self.jingle_library.scan(self.jingle_library_folders, self._on_library_progress, self._on_library_scan_done)
+
+    def _on_library_progress(self, done, total):
+        if hasattr(self, "library_window") and self.library_window.winfo_exists():
+            self.library_status_var.set(f"Analysiere {done}/{total} …")
+
+    def _on_library_scan_done(self, stats):
+        if self.jingle_categories:
+            # Neue oder gelöschte Dateien in gewählten Kategorien übernehmen
+            paths = self.jingle_library.paths_for_categories(self.jingle_categories)
+            if paths != self.jingle_paths:
+                self._set_jingle_selection(paths, self.jingle_categories, show_first=not self.jingle_paths)
+        self._refresh_library_window()
+        if self.jingle_library_folders:
+            self._library_rescan_id = self.root.after(LIBRARY_RESCAN_MS, self._rescan_library)
+
+    def _library_analysis(self, path):
+        """Läuft im Scan-Pool der Bibliothek; schreibt nicht in den Peak-Cache."""
+        envelope, duration = self._perform_wav_analysis(path)
+        return self._analysis_entry(envelope, duration)
+
+    def _cached_analysis(self, path):
+        return self.peak_cache.get(path) or self.jingle_library.get_entry(path)
 
     def _perform_wav_analysis(self, path):
-        samples = []
-        duration = 0
         try:
-            with wave.open(path, "rb") as wf:
-                n_channels = wf.getnchannels()
-                n_frames = wf.getnframes()
-                duration = n_frames / float(wf.getframerate())
-                
-                step = max(1, n_frames // 3000) 
-                raw = wf.readframes(n_frames)
-                sampwidth = wf.getsampwidth()
-                
-                if sampwidth == 4:
-                    fmt_code = 'f' 
-                    max_val = 1.0 
-                elif sampwidth == 2:
-                    fmt_code = 'h'
-                    max_val = float(2 ** 15)
-                elif sampwidth == 1:
-                    fmt_code = 'B'
-                    max_val = float(2 ** 7)
-                else:
-                    return [], 0 
-                
-                total = n_frames * n_channels
-                fmt = f"<{total}{fmt_code}"
-                unpacked = struct.unpack(fmt, raw)
-                
-                simple_data = unpacked[::n_channels*step] if n_channels > 1 else unpacked[::step]
-                
-                samples = []
-                if sampwidth == 1:
-                    samples = [abs(s - 128) / max_val for s in simple_data]
-                else:
-                    samples = [abs(s) / max_val for s in simple_data]
-                
-        except Exception as e: 
-             return [], 0
-        
-        reduced = self._reduce_samples(samples, 400)
-        return reduced, duration
+            return analyze_wav_envelope(path)
+        except Exception:
+            return None, 0
+
+    def _load_jingle_analysis(self, path, start_audio_after_analysis):
+        self._show_jingle_analysis(path, self._cached_analysis(path), start_audio_after_analysis)
+
+    def _show_jingle_analysis(self, path, cached, start_audio_after_analysis):
+        if cached:
+            # Bekannte Datei: Wellenform sofort zeichnen, keine erneute Dekodierung
+            self.analysis_service.cancel("jingle")
+            self._finish_loading(
+                WaveEnvelope.from_cache(cached.get("envelope")),
+                cached.get("duration", 0),
+                path,
+                start_audio_after_analysis,
+                cached,
+            )
+            return
+        self.analysis_service.submit(
+            "jingle",
+            path,
+            lambda reduced, duration: self._finish_loading(reduced, duration, path, start_audio_after_analysis),
+        )
+
+    def _analyze_and_cache(self, path):
+        """Läuft im Analyse-Pool: Cache prüfen, sonst analysieren und ablegen."""
+        cached = self._cached_analysis(path)
+        if cached:
+            return WaveEnvelope.from_cache(cached.get("envelope")), cached.get("duration", 0)
+        envelope, duration = self._perform_wav_analysis(path)
+        if duration > 0:
+            self.peak_cache.put(path, **self._analysis_entry(envelope, duration))
+        return envelope, duration
+
+    @staticmethod
+    def _envelope_fields(envelope, duration):
+        """Aus der Hüllkurve abgeleitete Werte: Lautheit und Startversätze in Sekunden."""
+        if not envelope or duration <= 0:
+            return {"loudness": None, "audible_start": 0.0, "loudest_start": 0.0}
+        seconds_per_point = duration / len(envelope)
+        window = LOUDEST_SECTION_SECONDS / seconds_per_point
+        return {
+            "loudness": envelope.gated_loudness_db(),
+            "audible_start": envelope.first_audible_index() * seconds_per_point,
+            "loudest_start": envelope.loudest_window_index(window) * seconds_per_point,
+        }
 
-    def _analyze_wav_thread(self, path, start_audio_after_analysis):
-        reduced, duration = self._perform_wav_analysis(path)
-        self.root.after(0, lambda: self._finish_loading(reduced, duration, path, start_audio_after_analysis))
+    @classmethod
+    def _analysis_entry(cls, envelope, duration):
+        return {
+            "duration": duration,
+            "envelope": envelope.to_cache() if envelope else None,
+            **cls._envelope_fields(envelope, duration),
+        }
 
+    def _start_loudness_scan(self, paths):
+        """Analysiert die Lautheit aller Jingles im Hintergrund und legt sie im Peak-Cache ab."""
+        self._loudness_scan_token += 1
+        threading.Thread(
+            target=self._loudness_scan_thread,
+            args=(list(paths), self._loudness_scan_token),
+            daemon=True,
+        ).start()
+
+    def _loudness_scan_thread(self, paths, token, batch_size=25):
+        batch = []
+        for index, path in enumerate(paths, start=1):
+            if token != self._loudness_scan_token:
+                return
+            cached = self._cached_analysis(path)
+            if cached and "loudness" in cached and "audible_start" in cached:
+                continue
+            if cached and cached.get("envelope"):
+                # Ältere Einträge: Werte aus der gespeicherten Hüllkurve, ohne neu zu dekodieren
+                envelope = WaveEnvelope.from_cache(cached["envelope"])
+                batch.append((path, self._envelope_fields(envelope, cached.get("duration", 0))))
+            else:
+                envelope, duration = self._perform_wav_analysis(path)
+                if duration <= 0:
+                    continue
+                batch.append((path, self._analysis_entry(envelope, duration)))
+            if len(batch) >= batch_size:
+                self.peak_cache.put_many(batch)
+                batch = []
+                self.root.after(0, self._report_loudness_scan, token, index, len(paths))
+        if batch:
+            self.peak_cache.put_many(batch)
+        self.root.after(0, self._report_loudness_scan, token, len(paths), len(paths))
+
+    def _report_loudness_scan(self, token, done, total):
+        if token != self._loudness_scan_token:
+            return
+        label = self._jingle_selection_label()
+        if done < total:
+            label += f" · Lautheit {done}/{total}"
+        self.file_label.config(text=label)
+
+    def _jingle_start_offset(self, analysis):
+        """Startversatz in Sekunden gemäß Einstellung (führende Stille / lautester Abschnitt)."""
+        field = JINGLE_START_MODES.get(self.jingle_start_mode.get())
+        if not field or not analysis:
+            return 0.0
+        return float(analysis.get(field) or 0.0)
+
+    def _apply_wave_trim(self, offset):
+        """Zeigt nur den ab ``offset`` gespielten Teil; Fortschritt rechnet mit der Restdauer."""
+        envelope, duration = self._wave_full
+        offset = min(max(0.0, offset), duration)
+        self.wave_offset = offset
+        self.wave_duration = duration - offset
+        if envelope and duration > 0:
+            envelope = envelope.trimmed(int(len(envelope) * offset / duration))
+        self.wave_reduced = envelope
+        self._draw_waveform()
 
-    def _reduce_samples(self, samples, count):
-        if not samples: return []
-        block = max(1, len(samples) // count)
-        reduced = []
-        for i in range(0, len(samples), block):
-            chunk = samples[i:i+block]
-            if chunk: reduced.append(max(chunk))
-        return reduced
+    def _jingle_gain(self, analysis):
+        if not self.jingle_normalize_enabled.get():
+            return 1.0
+        return loudness_gain(analysis.get("loudness") if analysis else None)
 
-    def _finish_loading(self, reduced_data, duration, path, start_audio):
-        self.wave_reduced = reduced_data
+    def _finish_loading(self, reduced_data, duration, path, start_audio, analysis=None):
+        if analysis is None:
+            # Frisch analysiert: Lautheit und Startversätze direkt aus der Hüllkurve
+            analysis = self._envelope_fields(reduced_data, duration)
         self.wave_duration = duration
         self.current_jingle_path = path
         
+        if self.wave_duration == 0 and path and self.jingle_pool.has(path):
+            self.wave_duration = self.jingle_pool.get_length(path)
+
         if self.wave_duration == 0 and path:
+            # Nicht über mixer.music: dort kann gerade ein Jingle gestreamt werden
             try:
-                pygame.mixer.music.load(path)
-                pygame_duration = pygame.mixer.music.get_length() 
-                if pygame_duration > 0:
-                    self.wave_duration = pygame_duration / 1000 
+                self.wave_duration = max(0.0, pygame.mixer.Sound(path).get_length())
             except Exception:
                 pass 
 
-        if reduced_data and max(reduced_data) > 0.001:
-            self.max_amp_scale = max(reduced_data)
+        if reduced_data and reduced_data.max_peak() > 0.001:
+            self.max_amp_scale = reduced_data.max_peak()
         else:
             self.max_amp_scale = 1.0 
-            
-        self._draw_waveform()
+
+        self._wave_full = (reduced_data, self.wave_duration)
+        if self.jingle_playing and path == self._playing_path:
+            offset = self.jingle_offset
+        else:
+            offset = self._jingle_start_offset(analysis)
+        self._apply_wave_trim(offset)
         
         if not reduced_data and self.wave_duration > 0:
-            self.wave_canvas.delete("all")
-            self.wave_canvas.create_text(self.wave_canvas.winfo_width()/2, 40, 
-                                         text="Visualisierung nicht unterstützt (Dateiformat)", 
-                                         font=("Arial", 10, "bold"), fill=ACCENT_RED)
+            self.waveform.show_message("Visualisierung nicht unterstützt (Dateiformat)",
+                                       font=("Arial", 10, "bold"), fill=ACCENT_RED)
 
         if start_audio:
-            self._start_audio_playback(path)
+            self._start_audio_playback(path, analysis)
+
+    def _prefetch_auto_jingle(self):
+        if self.jingle_triggered or self._prefetch_path or not self.jingle_paths or not self.auto_jingle_enabled.get():
+            return
+
+        path = random.choice(self.jingle_paths)
+        self._prefetch_path = path
+        self._prefetch_token += 1
+        threading.Thread(target=self._prefetch_jingle_thread, args=(path, self._prefetch_token), daemon=True).start()
+
+    def _prefetch_jingle_thread(self, path, token):
+        self.jingle_pool.prefetch(path)
+        if token != self._prefetch_token:
+            return
+        self.analysis_service.submit(
+            "prefetch",
+            path,
+            lambda reduced, duration: self._finish_prefetch(path, token, reduced, duration),
+        )
+
+    def _finish_prefetch(self, path, token, reduced, duration):
+        # Die Analyse liegt jetzt im Cache; die Anzeige gehört dem gewählten Jingle
+        if token != self._prefetch_token or self.jingle_playing or path != self.current_jingle_path:
+            return
+        self._finish_loading(reduced, duration, path, False)
+
+    def _take_prefetched_jingle(self):
+        path = self._prefetch_path
+        self._prefetch_path = None
+        self._prefetch_token += 1
+        if path in self.jingle_paths:
+            return path
+        return None
+
+    def _cancel_jingle_prefetch(self):
+        self._prefetch_path = None
+        self._prefetch_token += 1
+        self.jingle_pool.cancel_prefetch()
+        self.analysis_service.cancel("prefetch")
 
     def start_jingle_load_and_play(self, path):
-        self.stop_jingle()
-        self.wave_canvas.delete("all")
-        self.wave_canvas.create_text(self.wave_canvas.winfo_width()/2, 40, text="Lade Zufallsaudio...", fill="#999")
-        threading.Thread(target=self._analyze_wav_thread, args=(path, True), daemon=True).start()
+        # Ein laufender Jingle spielt weiter und wird beim Start des neuen übergeblendet
+        self._reset_jingle_ui()
+        self.waveform.clear()
+        cached = self._cached_analysis(path)
+        if self.jingle_pool.has(path):
+            # Vordekodiert: Ton sofort starten, Visualisierung folgt
+            self._start_audio_playback(path, cached)
+            self._show_jingle_analysis(path, cached, False)
+            return
+        self.waveform.show_message("Lade Zufallsaudio...")
+        self._show_jingle_analysis(path, cached, True)
 
     def _draw_waveform(self):
-        self.wave_canvas.delete("all")
-        w = self.wave_canvas.winfo_width()
-        h = self.wave_canvas.winfo_height()
-        mid = h / 2
-        if not self.wave_reduced: return
-        bar_w = w / len(self.wave_reduced)
-        
-        scale_factor = self.max_amp_scale if self.max_amp_scale > 0 else 1.0
-        
-        for i, val in enumerate(self.wave_reduced):
-            val_amp = min(1.0, val / scale_factor) 
-            bar_h = val_amp * (h / 2) * 0.90
-            
-            if val_amp < 0.15: color = "#DDD"
-            elif val_amp < 0.30: color = ACCENT_GREEN
-            elif val_amp < 0.60: color = "#ffc107"
-            else: color = ACCENT_RED
-            self.wave_canvas.create_rectangle(i * bar_w, mid - bar_h, (i * bar_w) + bar_w, mid + bar_h, fill=color, outline="")
+        self.waveform.set_data(self.wave_reduced, self.max_amp_scale)
 
     def _on_resize(self, event):
-        if self.wave_reduced: self._draw_waveform()
+        self.waveform.request_redraw()
 
-    def _start_audio_playback(self, path_to_play):
+    def _start_audio_playback(self, path_to_play, analysis):
         try:
-            pygame.mixer.music.load(path_to_play)
-            pygame.mixer.music.play()
+            gain = self._jingle_gain(analysis)
+            offset = self._jingle_start_offset(analysis)
+            sound = self.jingle_pool.sound_for(path_to_play, offset)
+            if sound is not None:
+                self._jingle_channel = self.channel_mixer.play_sound(sound, gain, JINGLE_CROSSFADE_SECONDS)
+            else:
+                self._jingle_channel = None
+                source = str(self.resample_cache.cached_path(path_to_play) or path_to_play)
+                offset = self.channel_mixer.play_music(source, gain, offset, JINGLE_CROSSFADE_SECONDS)
+            self.jingle_offset = offset
+            self._playing_path = path_to_play
+            if path_to_play == self.current_jingle_path and offset != self.wave_offset:
+                self._apply_wave_trim(offset)
             self.jingle_playing = True
-            self.jingle_start_time = time.time()
+            self.jingle_start_time = time.monotonic()
+            if self._update_loop_id is not None:
+                self.root.after_cancel(self._update_loop_id)
             self._update_loop()
         except Exception as e: messagebox.showerror("Fehler beim Abspielen", str(e))
 
@@ -1746,27 +5748,52 @@ class FussballTimer:
         self.start_jingle_load_and_play(path_to_play)
 
     def stop_jingle(self):
-        try: pygame.mixer.music.stop()
+        self._stop_jingle_audio()
+        self._cancel_jingle_prefetch()
+
+    def _stop_jingle_audio(self):
+        try: self.channel_mixer.stop()
         except: pass
+        self._reset_jingle_ui()
+
+    def _reset_jingle_ui(self):
         self.jingle_playing = False
+        self._jingle_channel = None
+        if self._update_loop_id is not None:
+            self.root.after_cancel(self._update_loop_id)
+            self._update_loop_id = None
+        self._progress_value = 0
         self.progress['value'] = 0
-        self.wave_canvas.delete("playhead")
+        self.waveform.hide_playhead()
+
+    def _jingle_position(self):
+        """Abspielposition in Sekunden, möglichst direkt vom Mixer."""
+        if self._jingle_channel is None:
+            pos_ms = pygame.mixer.music.get_pos()
+            if pos_ms >= 0:
+                return pos_ms / 1000.0
+        # Sound-Kanäle kennen keine Position: ab dem Start auf dem Kanal messen
+        return time.monotonic() - self.jingle_start_time
 
     def _update_loop(self):
+        self._update_loop_id = None
         if not self.jingle_playing: return
-        if not pygame.mixer.music.get_busy():
-            self.stop_jingle()
+        if not self.channel_mixer.is_busy():
+            # Ende erreicht oder wird ausgeblendet: nur die Anzeige zurücksetzen
+            self._reset_jingle_ui()
             return
         
-        elapsed = time.time() - self.jingle_start_time
+        elapsed = self._jingle_position()
         dur = self.wave_duration if self.wave_duration > 0 else 1
-        perc = (elapsed / dur) * 100
-        self.progress['value'] = perc
-        w = self.wave_canvas.winfo_width()
-        x = (elapsed / dur) * w
-        self.wave_canvas.delete("playhead")
-        self.wave_canvas.create_line(x, 0, x, 200, fill=RSK_BLUE, width=3, tags="playhead")
-        self.root.after(50, self._update_loop)
+        perc = int(min(100.0, (elapsed / dur) * 100))
+        if perc != self._progress_value:
+            self._progress_value = perc
+            self.progress['value'] = perc
+        self.waveform.set_playhead(elapsed / dur)
+
+        # Eine Aktualisierung je Pixel Fortschritt, begrenzt auf 15-100 ms
+        interval = int(min(100, max(15, self.waveform.ms_per_pixel(dur))))
+        self._update_loop_id = self.root.after(interval, self._update_loop)
 
 if __name__ == "__main__":
     root = tk.Tk()